@@ -5,6 +5,7 @@ Main entry point for SEO Indexation Checker
 
 import sys
 import argparse
+import logging
 import os
 from pathlib import Path
 
@@ -49,6 +50,11 @@ def main():
     """Main function"""
     args = parse_arguments()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="[%(levelname)s] %(message)s"
+    )
+
     # Change to script directory
     os.chdir(Path(__file__).parent)
 
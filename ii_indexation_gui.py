@@ -8,6 +8,8 @@ Modern, beautiful interface with professional styling
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import queue
+import logging
 import json
 import os
 import sys
@@ -26,6 +28,12 @@ except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all required files are in the src/ directory")
 
+from gui_helpers import select_listbox_rows
+
+# Log widget refresh interval and max messages written per refresh
+LOG_FLUSH_MS = 100
+LOG_BATCH_SIZE = 200
+
 class ModernStyle:
     """Modern UI styling constants"""
     # Color Palette - Professional Blue/Gray theme
@@ -67,9 +75,11 @@ class IIIndexationGUI:
         self.websites_config = None
         self.is_checking = False
         self.results = {}
+        self._log_queue = queue.Queue()  # (line, tag) pairs waiting to be drawn
 
         self.setup_ui()
         self.load_config()
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
 
     def setup_styles(self):
         """Setup modern ttk styles"""
@@ -489,9 +499,27 @@ class IIIndexationGUI:
         else:
             tag = "info"
 
-        self.results_text.insert(tk.END, f"[{timestamp}] {message}\n", tag)
-        self.results_text.see(tk.END)
-        self.root.update_idletasks()
+        # Safe from the check thread - the Tk event loop draws it in _drain_log
+        self._log_queue.put((f"[{timestamp}] {message}\n", tag))
+
+    def _drain_log(self):
+        """Write queued log messages to the results log in one insert call"""
+        chunks = []
+        try:
+            while len(chunks) < LOG_BATCH_SIZE * 2:
+                chunks.extend(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            if chunks:
+                # Text.insert takes alternating text/tag arguments
+                self.results_text.insert(tk.END, *chunks)
+                self.results_text.see(tk.END)
+            self.root.after(LOG_FLUSH_MS, self._drain_log)
+        except tk.TclError:
+            # Window is being destroyed - stop draining
+            pass
 
     def browse_config(self):
         """Browse for configuration file"""
@@ -517,24 +545,25 @@ class IIIndexationGUI:
                 self.websites_config = json.load(file)
 
             # Update websites listbox with beautiful formatting
-            self.websites_listbox.delete(0, tk.END)
-            for website in self.websites_config.get('websites', []):
-                enabled_icon = "✅" if website.get('enabled', True) else "❌"
-                gsc_icon = "🔗" if website.get('gsc_available', False) else "🔍"
-                method = "GSC API" if website.get('gsc_available', False) else "Search Fallback"
-
-                display_text = f"{enabled_icon} {website['name']}"
-                subtext = f"    {gsc_icon} {method}"
+            websites = self.websites_config.get('websites', [])
+            enabled = [website.get('enabled', True) for website in websites]
 
-                self.websites_listbox.insert(tk.END, display_text)
-                if not website.get('enabled', True):
-                    # Make disabled items gray
-                    self.websites_listbox.itemconfig(tk.END, fg=ModernStyle.TEXT_LIGHT)
+            # Insert every row in one call
+            self.websites_listbox.delete(0, tk.END)
+            rows = [
+                f"{'✅' if is_enabled else '❌'} {website['name']}"
+                for website, is_enabled in zip(websites, enabled)
+            ]
+            if rows:
+                self.websites_listbox.insert(tk.END, *rows)
+
+            # Make disabled items gray
+            for i, is_enabled in enumerate(enabled):
+                if not is_enabled:
+                    self.websites_listbox.itemconfig(i, fg=ModernStyle.TEXT_LIGHT)
 
             # Select all enabled websites by default
-            for i, website in enumerate(self.websites_config.get('websites', [])):
-                if website.get('enabled', True):
-                    self.websites_listbox.selection_set(i)
+            select_listbox_rows(self.websites_listbox, [i for i, is_enabled in enumerate(enabled) if is_enabled])
 
             self.log(f"✅ Loaded {len(self.websites_config.get('websites', []))} websites from configuration")
             self.update_status("Configuration Loaded", "ready")
@@ -589,13 +618,12 @@ class IIIndexationGUI:
 
                 if results:
                     # Save results
-                    filename = save_results_to_csv(results, website['name'])
+                    filename, indexed_count, _ = save_results_to_csv(results, website['name'])
                     if filename:
-                        indexed_count = sum(1 for r in results if 'INDEXED' in r['status'])
                         rate = (indexed_count / len(results) * 100) if results else 0
 
+                        # Keep only the summary - uploads re-read the CSV
                         self.results[website['name']] = {
-                            'results': results,
                             'filename': filename,
                             'total': len(results),
                             'indexed': indexed_count
@@ -718,6 +746,8 @@ class IIIndexationGUI:
 
 def main():
     """Main function"""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     # Change to script directory
     os.chdir(Path(__file__).parent)
 
@@ -8,6 +8,7 @@ import sys
 import json
 import os
 import threading
+import logging
 import time
 from pathlib import Path
 from datetime import datetime
@@ -509,8 +510,7 @@ class CheckThread(QThread):
 
                 if check_results:
                     # Save results
-                    filename = save_results_to_csv(check_results, website['name'])
-                    indexed_count = sum(1 for r in check_results if 'INDEXED' in r['status'])
+                    filename, indexed_count, _ = save_results_to_csv(check_results, website['name'])
 
                     results[website['name']] = {
                         'results': check_results,
@@ -1284,7 +1284,7 @@ class WebsiteDialog(QDialog):
     def get_website_data(self):
         """Get website data from form"""
         sitemap_text = self.sitemap_edit.toPlainText().strip()
-        sitemap_lines = [line.strip() for line in sitemap_text.split('\n') if line.strip()]
+        sitemap_lines = [s for s in (line.strip() for line in sitemap_text.splitlines()) if s]
 
         data = {
             'name': self.name_edit.text().strip(),
@@ -1806,6 +1806,8 @@ class SchedulerDialog(QDialog):
 
 def main():
     """Main application entry point"""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     app = QApplication(sys.argv)
 
     # Set application properties
@@ -7,6 +7,7 @@ Inbound Interactive's SEO Indexation Monitoring Tool
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import logging
 import json
 import os
 import sys
@@ -25,6 +26,8 @@ except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all required files are in the src/ directory")
 
+from gui_helpers import select_listbox_rows
+
 class IIIndexationGUI:
     def __init__(self, root):
         self.root = root
@@ -201,17 +204,19 @@ class IIIndexationGUI:
                 self.websites_config = json.load(file)
 
             # Update websites listbox
+            websites = self.websites_config.get('websites', [])
+            rows = [
+                f"{'✅' if w.get('enabled', True) else '❌'} {w['name']} "
+                f"({'🔗GSC' if w.get('gsc_available', False) else '🔍Search'})"
+                for w in websites
+            ]
             self.websites_listbox.delete(0, tk.END)
-            for website in self.websites_config.get('websites', []):
-                status = "✅" if website.get('enabled', True) else "❌"
-                gsc_status = "🔗GSC" if website.get('gsc_available', False) else "🔍Search"
-                display_text = f"{status} {website['name']} ({gsc_status})"
-                self.websites_listbox.insert(tk.END, display_text)
+            if rows:
+                self.websites_listbox.insert(tk.END, *rows)
 
             # Select all enabled websites by default
-            for i, website in enumerate(self.websites_config.get('websites', [])):
-                if website.get('enabled', True):
-                    self.websites_listbox.selection_set(i)
+            select_listbox_rows(self.websites_listbox,
+                                [i for i, w in enumerate(websites) if w.get('enabled', True)])
 
             self.log(f"Loaded {len(self.websites_config.get('websites', []))} websites from config")
             self.status_label.config(text="Config Loaded", fg="green")
@@ -225,7 +230,6 @@ class IIIndexationGUI:
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.results_text.insert(tk.END, f"[{timestamp}] {message}\n")
         self.results_text.see(tk.END)
-        self.root.update_idletasks()
 
     def start_check(self):
         """Start indexation check in background thread"""
@@ -273,19 +277,18 @@ class IIIndexationGUI:
 
                 if results:
                     # Save results
-                    filename = save_results_to_csv(results, website['name'])
+                    filename, indexed_count, total = save_results_to_csv(results, website['name'])
                     if filename:
                         self.results[website['name']] = {
                             'results': results,
                             'filename': filename,
-                            'total': len(results),
-                            'indexed': sum(1 for r in results if 'INDEXED' in r['status'])
+                            'total': total,
+                            'indexed': indexed_count
                         }
 
                         total_urls += len(results)
-                        total_indexed += sum(1 for r in results if 'INDEXED' in r['status'])
+                        total_indexed += indexed_count
 
-                        indexed_count = sum(1 for r in results if 'INDEXED' in r['status'])
                         rate = (indexed_count / len(results) * 100) if results else 0
 
                         self.log(f"✅ {website['name']}: {indexed_count}/{len(results)} ({rate:.1f}%) indexed")
@@ -387,6 +390,8 @@ class IIIndexationGUI:
 
 def main():
     """Main function"""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     # Change to script directory
     os.chdir(Path(__file__).parent)
 
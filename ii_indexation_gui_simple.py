@@ -7,80 +7,211 @@ Inbound Interactive's Easy-to-Use SEO Tool
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import queue
 import json
 import os
 import sys
+import time
 from pathlib import Path
-import webbrowser
 from datetime import datetime
-import io
-import contextlib
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Google Sheets and the scheduler are imported on first use to keep startup fast
 try:
-    from indexation_checker import check_website_indexation, save_results_to_csv
-    from google_sheets_integration import GoogleSheetsIntegration
-    from search_console_checker import SearchConsoleChecker
-    from scheduler import IndexationScheduler
+    from indexation_checker import (
+        LazyGSC, check_website_indexation, save_results_to_csv
+    )
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all required files are in the src/ directory")
 
-class ConsoleRedirector:
-    """Redirect console output to GUI log"""
+from gui_helpers import select_listbox_rows
+
+# orjson is an optional speedup for config parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Service-account key shared by Google Sheets uploads
+SHEETS_CREDENTIALS_PATH = 'config/google_credentials.json'
+
+# Read at startup to decide whether the scheduler needs to be started
+SCHEDULER_CONFIG_PATH = 'config/scheduler.json'
+
+# Scheduler run_day is 1-based into this (1 = Monday)
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+WEEKDAY_INDEX = {name: day for day, name in enumerate(WEEKDAYS, 1)}
+
+# Scheduler interval_type -> label shown in the scheduler dialog (in display order)
+INTERVAL_TYPE_LABELS = {
+    'hours': 'Every __ hours',
+    'daily': 'Daily',
+    'weekly': 'Weekly',
+    'biweekly': 'Bi-weekly',
+    'monthly': 'Monthly'
+}
+INTERVAL_TYPE_BY_LABEL = {label: interval_type for interval_type, label in INTERVAL_TYPE_LABELS.items()}
+
+# Interval types whose run_day is a weekday
+WEEKLY_INTERVAL_TYPES = frozenset({'weekly', 'biweekly'})
+
+# Scheduler dialog preview for each interval label (anything else falls back to "at {time}")
+SCHEDULE_PREVIEW_FORMATS = {
+    'Every __ hours': "every {interval} hours at {time}",
+    'Daily': "daily at {time}",
+    'Weekly': "weekly on {weekday} at {time}",
+    'Bi-weekly': "bi-weekly on {weekday} at {time}",
+    'Monthly': "monthly on day {day} at {time}"
+}
+
+# Website manager label for each explicit checking_method ('auto' is labelled per site)
+METHOD_DISPLAY = {'gsc': 'GSC', 'indexed_api': 'IndexedAPI', 'google_search': 'Search'}
+
+# Log widget refresh interval and max messages written per refresh
+LOG_FLUSH_MS = 50
+LOG_BATCH_SIZE = 200
+
+# Max log messages waiting to be drawn - the oldest are dropped beyond this
+LOG_QUEUE_SIZE = 10000
+
+# Websites checked at once by a scheduled run (checks are network-bound)
+SCHEDULED_CHECK_WORKERS = 8
+
+# Concurrent Google Sheets uploads (kept small to stay within API quota)
+SHEETS_UPLOAD_WORKERS = 4
+
+# Loggers whose records are shown in the activity log
+APP_LOGGERS = (
+    'indexation_checker', 'search_console_checker', 'indexed_api_checker',
+    'google_sheets_integration', 'scheduler', 'result_cache', 'ii_indexation_gui'
+)
+
+# Activity-log tag for each logging level
+_LEVEL_TAGS = {
+    'CRITICAL': '[ERROR]',
+    'ERROR': '[ERROR]',
+    'WARNING': '[WARN]',
+}
+
+# Icon shown in place of each activity-log tag
+_LOG_PREFIX_ICONS = {
+    '[ERROR]': '❌',
+    '[WARN]': '⚠️',
+    '[SUCCESS]': '✅',
+    '[INFO]': '🖥️',
+}
+_LOG_PREFIXES = tuple(_LOG_PREFIX_ICONS)
+
+logger = logging.getLogger('ii_indexation_gui')
+
+ResultSummary = namedtuple('ResultSummary', ['indexed', 'errors', 'rate_limited', 'gsc_disabled'])
+
+# What the GUI keeps per checked website - the rows themselves stay in the CSV
+WebsiteRunResult = namedtuple('WebsiteRunResult', ['filename', 'total', 'indexed', 'errors'])
+
+def summarize_results(results):
+    """Count indexed/error results and flag common problems in a single pass"""
+    indexed = errors = 0
+    rate_limited = gsc_disabled = False
+    for r in results:
+        status = r['status']
+        indexed += r['is_indexed']
+        if 'ERROR' in status or 'RATE LIMITED' in status:
+            errors += 1
+            rate_limited = rate_limited or 'HTTP 429' in status or 'RATE LIMITED' in status
+        if not gsc_disabled:
+            gsc_disabled = ('Google Search Console API has not been used' in status or
+                            'Google Search Console API has not been used' in r['method'])
+    return ResultSummary(indexed, errors, rate_limited, gsc_disabled)
+
+# Last formatted log timestamp as [epoch second, "HH:MM:SS"]
+_timestamp_cache = [0, '']
+
+def log_timestamp():
+    """Current time as HH:MM:SS, formatted at most once per second"""
+    now = int(time.time())
+    cache = _timestamp_cache
+    if cache[0] != now:
+        # Racing threads can only write the same string for the same second
+        cache[1] = time.strftime('%H:%M:%S', time.localtime(now))
+        cache[0] = now
+    return cache[1]
+
+# Service account email from the credentials file, keyed by (mtime_ns, size)
+_service_email_cache = {}
+
+def read_service_email(path):
+    """Service account email from a credentials file, re-parsed only when the file changes"""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _service_email_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(path, 'r') as f:
+        service_email = json.load(f).get('client_email', 'Unknown')
+    _service_email_cache[path] = (key, service_email)
+    return service_email
+
+def remember_service_email(path, service_email):
+    """Seed the service email cache for a credentials file that was just written"""
+    st = os.stat(path)
+    _service_email_cache[path] = ((st.st_mtime_ns, st.st_size), service_email)
+
+def prewarm_import(module_name):
+    """Import a module in the background so a later import is a cache hit"""
+    try:
+        __import__(module_name)
+    except Exception as e:
+        # The real import at first use reports the problem
+        logger.debug("Prewarming %s failed: %s", module_name, e)
+
+def center_on_parent(window, parent):
+    """Center a window over its parent (call after its widgets are packed)"""
+    window.update_idletasks()
+    x = parent.winfo_x() + (parent.winfo_width() // 2) - (window.winfo_width() // 2)
+    y = parent.winfo_y() + (parent.winfo_height() // 2) - (window.winfo_height() // 2)
+    window.geometry(f"+{x}+{y}")
+
+def read_json_file(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def write_json_file(path, data, mode=0o666):
+    """
+    Write JSON in one call via a temp file, so a crash can't leave a half-written config
+
+    mode is applied (less the umask) when the file is created - pass 0o600 for secrets.
+    """
+    payload = json.dumps(data, indent=2)
+    tmp_path = path + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        file.write(payload)
+    os.replace(tmp_path, path)
+
+class QueueLogHandler(logging.Handler):
+    """Send log records from the app's modules to the GUI log"""
     def __init__(self, log_function):
+        super().__init__(level=logging.INFO)
         self.log_function = log_function
-        self.original_stdout = sys.stdout
-        self.original_stderr = sys.stderr
-
-    def write(self, message):
-        try:
-            if message.strip():  # Only log non-empty messages
-                # Clean up the message
-                clean_message = message.strip()
-
-                # Filter out some noise but keep important messages
-                if (clean_message and
-                    not clean_message.startswith('[') and
-                    not clean_message.startswith('Traceback') and
-                    'update_idletasks' not in clean_message and
-                    'invalid command name' not in clean_message and
-                    'object address' not in clean_message):
-
-                    # Categorize message types
-                    if any(keyword in clean_message.lower() for keyword in ['error', 'failed', 'exception']):
-                        self.log_function(f"[ERROR] {clean_message}")
-                    elif any(keyword in clean_message.lower() for keyword in ['warning', 'warn']):
-                        self.log_function(f"[WARN] {clean_message}")
-                    elif any(keyword in clean_message.lower() for keyword in ['success', 'complete', 'done', 'uploaded']):
-                        self.log_function(f"[SUCCESS] {clean_message}")
-                    else:
-                        self.log_function(f"[INFO] {clean_message}")
-
-        except Exception:
-            # If logging fails, just ignore it to prevent recursive errors
-            pass
 
-        # Always write to original stdout for backup
+    def emit(self, record):
         try:
-            self.original_stdout.write(message)
+            tag = _LEVEL_TAGS.get(record.levelname, '[INFO]')
+            self.log_function(f"{tag} {self.format(record)}")
         except Exception:
-            pass
-
-    def flush(self):
-        self.original_stdout.flush()
-
-    def start_capture(self):
-        """Start capturing console output"""
-        sys.stdout = self
-        sys.stderr = self
-
-    def stop_capture(self):
-        """Stop capturing and restore original output"""
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
+            self.handleError(record)
 
 class SimpleIndexationGUI:
     def __init__(self, root):
@@ -92,14 +223,19 @@ class SimpleIndexationGUI:
 
         # Variables
         self.websites_config = None
+        self._config_cache = {}  # (path, mtime_ns) -> parsed config
         self.is_checking = False
         self.results = {}
-        self.scheduler = IndexationScheduler()
-        self.console_redirector = None
+        self._scheduler = None  # Built on first use - see the scheduler property
+        self._sheets = None  # Shared Sheets client - see get_sheets
+        self._sheets_mtime = None
+        self._sheets_lock = threading.Lock()
+        self.log_handler = None
         self.stop_event = threading.Event()  # For stopping checks
+        self._log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)  # Log lines waiting to be drawn
 
         self.setup_ui()
-        self.setup_console_capture()
+        self.setup_log_capture()
         self.load_config()
         self.setup_scheduler()
 
@@ -143,7 +279,7 @@ class SimpleIndexationGUI:
         browse_btn = tk.Button(config_input, text="...", command=self.browse_config, width=3, font=('Trebuchet MS', 8))
         browse_btn.pack(side='right', padx=(2, 0))
 
-        reload_btn = tk.Button(config_frame, text="Reload", command=self.load_config,
+        reload_btn = tk.Button(config_frame, text="Reload", command=lambda: self.load_config(force=True),
                               bg='#3498db', fg='white', font=('Trebuchet MS', 9), relief='flat')
         reload_btn.pack(pady=2)
 
@@ -180,6 +316,11 @@ class SimpleIndexationGUI:
         self.progress = ttk.Progressbar(left_frame, mode='indeterminate')
         self.progress.pack(fill='x', pady=5)
 
+        # Manual checks re-check every URL unless asked to reuse cached results
+        self.use_cache_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(left_frame, text="Reuse recent results (cache_ttl_hours)", variable=self.use_cache_var,
+                       font=('Trebuchet MS', 8), bg='#f8f9fa').pack(anchor='w')
+
         # Action buttons - compact
         self.check_button = tk.Button(
             left_frame,
@@ -312,66 +453,64 @@ class SimpleIndexationGUI:
         self.log("STEP 3: Wait for results, then click 'UPLOAD TO SHEETS' if needed")
         self.log("-" * 60)
 
+        # Start the log consumer on the Tk event loop
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
+
     def log(self, message):
         """Add message to log with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Format different types of messages
-        if message.startswith("[ERROR]"):
-            # Error messages from console
-            clean_msg = message[7:].strip()
-            formatted_msg = f"[{timestamp}] ❌ {clean_msg}\n"
-        elif message.startswith("[WARN]"):
-            # Warning messages from console
-            clean_msg = message[6:].strip()
-            formatted_msg = f"[{timestamp}] ⚠️ {clean_msg}\n"
-        elif message.startswith("[SUCCESS]"):
-            # Success messages from console
-            clean_msg = message[9:].strip()
-            formatted_msg = f"[{timestamp}] ✅ {clean_msg}\n"
-        elif message.startswith("[INFO]"):
-            # Info messages from console
-            clean_msg = message[6:].strip()
-            formatted_msg = f"[{timestamp}] 🖥️ {clean_msg}\n"
-        elif message.startswith("🕒") or message.startswith("🔍") or message.startswith("📊"):
-            # Scheduled or important operations
-            formatted_msg = f"[{timestamp}] {message}\n"
+        timestamp = log_timestamp()
+
+        # Format different types of messages - tagged messages get an icon
+        if message.startswith(_LOG_PREFIXES):
+            prefix = message[:message.index(']') + 1]
+            formatted_msg = f"[{timestamp}] {_LOG_PREFIX_ICONS[prefix]} {message[len(prefix):].strip()}\n"
         else:
             # Regular log messages
             formatted_msg = f"[{timestamp}] {message}\n"
 
-        # Thread-safe GUI update
+        # Thread-safe: the Tk event loop picks this up in _drain_log.
+        # Never block the caller - under a log flood drop the oldest line instead.
+        while True:
+            try:
+                self._log_queue.put_nowait(formatted_msg)
+                return
+            except queue.Full:
+                try:
+                    self._log_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _drain_log(self):
+        """Write queued log messages to the log widget in one batch"""
+        batch = []
         try:
-            if threading.current_thread() == threading.main_thread():
-                self.results_text.insert(tk.END, formatted_msg)
-                self.results_text.see(tk.END)
-                self.root.update_idletasks()
-            else:
-                # Schedule GUI update from main thread
-                self.root.after(0, lambda: self._add_to_log(formatted_msg))
-        except Exception:
-            # If GUI update fails, just ignore it to prevent crashes
+            while len(batch) < LOG_BATCH_SIZE:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
             pass
 
-    def _add_to_log(self, formatted_message):
-        """Helper method to add message to log from main thread"""
         try:
-            self.results_text.insert(tk.END, formatted_message)
-            self.results_text.see(tk.END)
+            if batch:
+                self.results_text.insert(tk.END, ''.join(batch))
+                self.results_text.see(tk.END)
+            self.root.after(LOG_FLUSH_MS, self._drain_log)
         except Exception:
-            # If GUI update fails, just ignore it
+            # Window is being destroyed - stop draining
             pass
 
-    def setup_console_capture(self):
-        """Setup console output capture"""
+    def setup_log_capture(self):
+        """Show log records from the checker modules in the activity log"""
         try:
-            self.console_redirector = ConsoleRedirector(self.log)
-            self.console_redirector.start_capture()
-            self.log("Console output capture enabled - CMD messages will appear here")
+            self.log_handler = QueueLogHandler(self.log)
+            for name in APP_LOGGERS:
+                app_logger = logging.getLogger(name)
+                app_logger.setLevel(logging.INFO)
+                app_logger.addHandler(self.log_handler)
+            self.log("Log capture enabled - checker messages will appear here")
         except Exception as e:
-            self.log(f"Warning: Console capture setup failed: {e}")
+            self.log(f"Warning: Log capture setup failed: {e}")
 
-        # Handle application closing to restore console
+        # Handle application closing to detach the log handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def browse_config(self):
@@ -385,8 +524,8 @@ class SimpleIndexationGUI:
             self.config_path_var.set(filename)
             self.load_config()
 
-    def load_config(self):
-        """Load websites configuration"""
+    def load_config(self, force=False):
+        """Load websites configuration (skipped if the file is unchanged, unless forced)"""
         try:
             config_path = self.config_path_var.get()
             if not os.path.exists(config_path):
@@ -401,22 +540,42 @@ class SimpleIndexationGUI:
                     self.status_label.config(text="Config file missing", fg="red")
                     return
 
-            with open(config_path, 'r') as file:
-                self.websites_config = json.load(file)
+            cache_key = (config_path, os.stat(config_path).st_mtime_ns)
+            config = self._config_cache.get(cache_key)
+            if config is not None and config is self.websites_config and not force:
+                # Same file, already loaded and displayed
+                return
+
+            if config is None:
+                config = read_json_file(config_path)
+                self._config_cache = {cache_key: config}
+            self.websites_config = config
+
+            self.on_config_reloaded()
+
+        except Exception as e:
+            self.log(f"Error loading config: {e}")
+            self.status_label.config(text="Config error", fg="red")
 
+    def on_config_reloaded(self):
+        """Refresh the websites list from the in-memory config"""
+        try:
             # Simple website display
+            websites = self.websites_config.get('websites', [])
+            rows = [
+                f"{'✓' if w.get('enabled', True) else '✗'} {w['name']} "
+                f"({'GSC' if w.get('gsc_available', False) else 'Search'})"
+                for w in websites
+            ]
             self.websites_listbox.delete(0, tk.END)
-            for i, website in enumerate(self.websites_config.get('websites', [])):
-                status = "✓" if website.get('enabled', True) else "✗"
-                method = "GSC" if website.get('gsc_available', False) else "Search"
-                display = f"{status} {website['name']} ({method})"
-                self.websites_listbox.insert(tk.END, display)
+            if rows:
+                self.websites_listbox.insert(tk.END, *rows)
 
-                # Auto-select enabled websites
-                if website.get('enabled', True):
-                    self.websites_listbox.selection_set(i)
+            # Auto-select enabled websites
+            select_listbox_rows(self.websites_listbox,
+                                [i for i, w in enumerate(websites) if w.get('enabled', True)])
 
-            count = len(self.websites_config.get('websites', []))
+            count = len(websites)
             self.log(f"Loaded {count} websites from configuration")
             self.status_label.config(text=f"Ready - {count} websites loaded", fg="green")
 
@@ -454,7 +613,7 @@ class SimpleIndexationGUI:
         self.summary_label.config(text="Checking websites... Please wait", bg="#fff3cd")
 
         # Start background thread
-        thread = threading.Thread(target=self.run_check, args=(selected,))
+        thread = threading.Thread(target=self.run_check, args=(selected, self.use_cache_var.get()))
         thread.daemon = True
         thread.start()
 
@@ -482,13 +641,16 @@ class SimpleIndexationGUI:
         else:
             self.status_label.config(text="Check completed", fg="green")
 
-    def run_check(self, selected_indices):
+    def run_check(self, selected_indices, use_cache=False):
         """Run indexation check in background"""
         try:
             self.results = {}
             total_indexed = 0
             total_urls = 0
 
+            # One Search Console client for the whole run, created when a site first needs it
+            gsc = LazyGSC()
+
             for index in selected_indices:
                 # Check if stop was requested
                 if self.stop_event.is_set():
@@ -509,22 +671,22 @@ class SimpleIndexationGUI:
                 self.log(f"   ⚠️ Note: Large sites may take several minutes to check...")
 
                 # Run the check (pass stop_event for cancellation)
-                results = check_website_indexation(website, stop_event=self.stop_event)
+                results = check_website_indexation(website, stop_event=self.stop_event, gsc=gsc,
+                                                   use_cache=use_cache)
 
                 if results:
                     # Save results
-                    filename = save_results_to_csv(results, website['name'])
+                    filename, _, _ = save_results_to_csv(results, website['name'])
                     if filename:
-                        indexed_count = sum(1 for r in results if 'INDEXED' in r['status'])
-                        error_count = sum(1 for r in results if 'ERROR' in r['status'])
+                        summary = summarize_results(results)
+                        indexed_count = summary.indexed
+                        error_count = summary.errors
                         rate = (indexed_count / len(results) * 100) if results else 0
 
-                        self.results[website['name']] = {
-                            'results': results,
-                            'filename': filename,
-                            'total': len(results),
-                            'indexed': indexed_count
-                        }
+                        # Keep only the summary - uploads re-read the CSV
+                        self.results[website['name']] = WebsiteRunResult(
+                            filename, len(results), indexed_count, error_count
+                        )
 
                         total_urls += len(results)
                         total_indexed += indexed_count
@@ -533,12 +695,9 @@ class SimpleIndexationGUI:
                             self.log(f"⚠️ {website['name']}: {indexed_count}/{len(results)} indexed ({rate:.1f}%) - {error_count} errors")
 
                             # Check for specific common errors
-                            has_rate_limit = any('HTTP 429' in r['status'] for r in results if 'ERROR' in r['status'])
-                            has_gsc_disabled = any('Google Search Console API has not been used' in str(r) for r in results)
-
-                            if has_rate_limit:
+                            if summary.rate_limited:
                                 self.log(f"   💡 TIP: Google is rate-limiting searches. Enable Google Search Console for better results!")
-                            if has_gsc_disabled:
+                            if summary.gsc_disabled:
                                 self.log(f"   💡 TIP: Enable Search Console API in Google Cloud Console")
                         else:
                             self.log(f"✓ {website['name']}: {indexed_count}/{len(results)} indexed ({rate:.1f}%)")
@@ -593,7 +752,7 @@ class SimpleIndexationGUI:
             self.status_label.config(text="Uploading...", fg="orange")
 
             # Initialize sheets integration
-            sheets = GoogleSheetsIntegration('config/google_credentials.json')
+            sheets = self.get_sheets()
 
             if not sheets.client:
                 self.log("Google Sheets not configured")
@@ -602,17 +761,13 @@ class SimpleIndexationGUI:
                 self.status_label.config(text="Sheets not configured", fg="red")
                 return
 
-            # Upload files
             uploaded = 0
-            for website_name, data in self.results.items():
-                filename = data['filename']
-                if os.path.exists(filename):
-                    success = sheets.upload_results(filename)
-                    if success:
-                        uploaded += 1
-                        self.log(f"✓ Uploaded {website_name}")
-                    else:
-                        self.log(f"✗ Failed to upload {website_name}")
+            for website_name, success in self.upload_result_files(sheets):
+                if success:
+                    uploaded += 1
+                    self.log(f"✓ Uploaded {website_name}")
+                else:
+                    self.log(f"✗ Failed to upload {website_name}")
 
             if uploaded > 0:
                 sheets.create_summary_sheet()
@@ -628,6 +783,47 @@ class SimpleIndexationGUI:
             self.status_label.config(text="Upload error", fg="red")
             messagebox.showerror("Error", f"Upload failed: {e}")
 
+    def get_sheets(self):
+        """Shared Google Sheets integration, rebuilt only when the credentials file changes"""
+        from google_sheets_integration import GoogleSheetsIntegration
+
+        try:
+            mtime = os.stat(SHEETS_CREDENTIALS_PATH).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        # Scheduled uploads call this from a background thread
+        with self._sheets_lock:
+            if self._sheets is None or mtime != self._sheets_mtime:
+                self._sheets = GoogleSheetsIntegration(SHEETS_CREDENTIALS_PATH)
+                self._sheets_mtime = mtime
+            return self._sheets
+
+    def upload_result_files(self, sheets):
+        """
+        Upload each website's results CSV concurrently
+
+        Each upload is an independent API round-trip; 429s are retried with
+        backoff inside the Sheets integration.
+
+        Yields:
+            (website_name, success) for each website whose CSV still exists
+        """
+        # Stat every file once up front rather than inside the workers
+        existing = {}
+        for website_name, run in self.results.items():
+            if os.path.isfile(run.filename):
+                existing[website_name] = run.filename
+            else:
+                self.log(f"✗ Results file missing for {website_name}: {run.filename}")
+
+        def upload_one(item):
+            website_name, filename = item
+            return website_name, sheets.upload_results(filename)
+
+        with ThreadPoolExecutor(max_workers=SHEETS_UPLOAD_WORKERS) as executor:
+            yield from executor.map(upload_one, existing.items())
+
     def open_results_folder(self):
         """Open results folder"""
         results_dir = "results"
@@ -650,6 +846,7 @@ class SimpleIndexationGUI:
 
     def open_setup_guide(self):
         """Open setup guide"""
+        import webbrowser
         setup_file = "docs/SETUP.md"
         if os.path.exists(setup_file):
             webbrowser.open(f"file://{os.path.abspath(setup_file)}")
@@ -664,22 +861,49 @@ class SimpleIndexationGUI:
 
     def open_scheduler(self):
         """Open scheduler dialog"""
-        SchedulerDialog(self.root, self)
+        try:
+            SchedulerDialog(self.root, self)
+        except ImportError as e:
+            self.log(f"Scheduler unavailable: {e}")
+            messagebox.showerror("Scheduler Unavailable", f"Could not load the scheduler: {e}")
 
     def open_sheets_setup(self):
         """Open Google Sheets setup dialog"""
         GoogleSheetsSetupDialog(self.root, self)
 
+    @property
+    def scheduler(self):
+        """The indexation scheduler, created (and wired to the GUI) on first access"""
+        if self._scheduler is None:
+            from scheduler import IndexationScheduler
+            scheduler = IndexationScheduler(SCHEDULER_CONFIG_PATH)
+            scheduler.set_callback(self.scheduled_check_callback)
+            # Status changes can come from the scheduler thread - hand them to Tk
+            scheduler.add_listener(
+                lambda status: self.root.after(0, lambda: self.apply_scheduler_status(status))
+            )
+            self._scheduler = scheduler
+        return self._scheduler
+
     def setup_scheduler(self):
-        """Setup scheduler with callback"""
-        self.scheduler.set_callback(self.scheduled_check_callback)
-        if self.scheduler.config.get('enabled', False):
+        """Start the scheduler if it is enabled - otherwise it isn't built until first opened"""
+        try:
+            enabled = read_json_file(SCHEDULER_CONFIG_PATH).get('enabled', False)
+        except Exception:
+            enabled = False
+
+        if not enabled:
+            self.scheduler_status_label.config(text="Scheduler: OFF", fg='#bdc3c7')
+            return
+
+        try:
             self.scheduler.start_scheduler()
-        self.update_scheduler_status()
+            self.apply_scheduler_status(self.scheduler.get_status())
+        except ImportError as e:
+            self.log(f"Scheduler unavailable: {e}")
 
-    def update_scheduler_status(self):
-        """Update scheduler status in UI"""
-        status = self.scheduler.get_status()
+    def apply_scheduler_status(self, status):
+        """Show scheduler status in the info bar"""
         if status['enabled'] and status['running']:
             next_run = status.get('next_run')
             if next_run:
@@ -687,34 +911,28 @@ class SimpleIndexationGUI:
                     next_dt = datetime.fromisoformat(next_run)
                     next_str = next_dt.strftime("%m/%d %H:%M")
                     self.scheduler_status_label.config(text=f"Scheduler: ON (Next: {next_str})", fg='#2ecc71')
-                except:
+                except ValueError:
                     self.scheduler_status_label.config(text="Scheduler: ON", fg='#2ecc71')
             else:
                 self.scheduler_status_label.config(text="Scheduler: ON", fg='#2ecc71')
         else:
             self.scheduler_status_label.config(text="Scheduler: OFF", fg='#bdc3c7')
 
-        # Schedule next update in 30 seconds
-        self.root.after(30000, self.update_scheduler_status)
-
     def scheduled_check_callback(self, enabled_websites, upload_sheets):
         """Callback for scheduled checks"""
         try:
             self.log("🕒 SCHEDULED CHECK STARTED")
 
             # Get selected websites or use all enabled
+            websites = self.websites_config.get('websites', [])
             if enabled_websites:
                 # Filter to only enabled websites from the list
-                selected_indices = []
-                for i, website in enumerate(self.websites_config.get('websites', [])):
-                    if website['name'] in enabled_websites and website.get('enabled', True):
-                        selected_indices.append(i)
+                wanted = set(enabled_websites)
+                selected_indices = [i for i, website in enumerate(websites)
+                                    if website['name'] in wanted and website.get('enabled', True)]
             else:
                 # Use all enabled websites
-                selected_indices = []
-                for i, website in enumerate(self.websites_config.get('websites', [])):
-                    if website.get('enabled', True):
-                        selected_indices.append(i)
+                selected_indices = [i for i, website in enumerate(websites) if website.get('enabled', True)]
 
             if selected_indices:
                 # Run check in background
@@ -734,29 +952,49 @@ class SimpleIndexationGUI:
             total_indexed = 0
             total_urls = 0
 
-            for index in selected_indices:
-                website = self.websites_config['websites'][index]
-                self.log(f"🔍 Checking {website['name']}...")
+            # Workers share one sites.list call, made when a site first needs it;
+            # each still builds its own API client (it isn't thread-safe)
+            gsc = LazyGSC()
 
-                results = check_website_indexation(website)
-
-                if results:
-                    filename = save_results_to_csv(results, website['name'])
-                    if filename:
-                        indexed_count = sum(1 for r in results if 'INDEXED' in r['status'])
-                        rate = (indexed_count / len(results) * 100) if results else 0
+            # Check and save each website in a worker; self.log is safe to call from any thread
+            def check_one(website):
+                self.log(f"🔍 Checking {website['name']}...")
+                results = check_website_indexation(website, gsc=gsc)
+                if not results:
+                    return None
+                filename, _, _ = save_results_to_csv(results, website['name'])
+                if not filename:
+                    return None
+                return filename, len(results), summarize_results(results)
+
+            websites = [self.websites_config['websites'][index] for index in selected_indices]
+            with ThreadPoolExecutor(max_workers=min(SCHEDULED_CHECK_WORKERS, len(websites))) as executor:
+                futures = {executor.submit(check_one, website): website for website in websites}
+
+                # Counters are only touched here, on the scheduled-check thread
+                for future in as_completed(futures):
+                    website = futures[future]
+                    try:
+                        checked = future.result()
+                    except Exception as e:
+                        self.log(f"✗ {website['name']}: check failed - {e}")
+                        continue
+                    if checked is None:
+                        continue
+
+                    filename, total, summary = checked
+                    indexed_count = summary.indexed
+                    rate = (indexed_count / total * 100) if total else 0
+
+                    # Keep only the summary - uploads re-read the CSV
+                    self.results[website['name']] = WebsiteRunResult(
+                        filename, total, indexed_count, summary.errors
+                    )
 
-                        self.results[website['name']] = {
-                            'results': results,
-                            'filename': filename,
-                            'total': len(results),
-                            'indexed': indexed_count
-                        }
+                    total_urls += total
+                    total_indexed += indexed_count
 
-                        total_urls += len(results)
-                        total_indexed += indexed_count
-
-                        self.log(f"✓ {website['name']}: {indexed_count}/{len(results)} indexed ({rate:.1f}%)")
+                    self.log(f"✓ {website['name']}: {indexed_count}/{total} indexed ({rate:.1f}%)")
 
             if total_urls > 0:
                 overall_rate = (total_indexed / total_urls * 100)
@@ -765,7 +1003,7 @@ class SimpleIndexationGUI:
                 # Upload to sheets if requested
                 if upload_sheets and self.results:
                     self.log("📊 Uploading scheduled results to Google Sheets...")
-                    self.root.after(0, self.upload_scheduled_results)
+                    self.upload_scheduled_results()  # Already off the Tk thread
 
         except Exception as e:
             self.log(f"Scheduled check error: {e}")
@@ -773,16 +1011,13 @@ class SimpleIndexationGUI:
     def upload_scheduled_results(self):
         """Upload scheduled results to Google Sheets"""
         try:
-            sheets = GoogleSheetsIntegration('config/google_credentials.json')
+            sheets = self.get_sheets()
             if sheets.client:
                 uploaded = 0
-                for website_name, data in self.results.items():
-                    filename = data['filename']
-                    if os.path.exists(filename):
-                        success = sheets.upload_results(filename)
-                        if success:
-                            uploaded += 1
-                            self.log(f"✓ Uploaded {website_name} to sheets")
+                for website_name, success in self.upload_result_files(sheets):
+                    if success:
+                        uploaded += 1
+                        self.log(f"✓ Uploaded {website_name} to sheets")
 
                 if uploaded > 0:
                     sheets.create_summary_sheet()
@@ -793,18 +1028,15 @@ class SimpleIndexationGUI:
             self.log(f"Scheduled upload error: {e}")
 
     def test_console_log(self):
-        """Test console output capture with different message types"""
-        self.log("Testing console output capture...")
+        """Test log capture with different message levels"""
+        self.log("Testing log capture...")
 
-        # Test different types of print statements that will be captured
-        print("This is a regular info message from Python")
-        print("Warning: This is a test warning message")
-        print("Error: This is a test error message")
-        print("Success: Console capture is working!")
-        print("Failed to connect to test service")
-        print("Upload completed successfully")
+        # Test different log levels that will be captured
+        logger.info("This is a regular info message from Python")
+        logger.warning("This is a test warning message")
+        logger.error("This is a test error message")
 
-        self.log("Console capture test complete - check the messages above!")
+        self.log("Log capture test complete - check the messages above!")
 
     def run_diagnostics(self):
         """Run comprehensive diagnostics to identify issues"""
@@ -836,8 +1068,7 @@ class SimpleIndexationGUI:
         # Test 3: Google Sheets
         self.log("3. Testing Google Sheets...")
         try:
-            from google_sheets_integration import GoogleSheetsIntegration
-            sheets = GoogleSheetsIntegration('config/google_credentials.json')
+            sheets = self.get_sheets()
             if sheets.client:
                 self.log("   ✅ Google Sheets client working")
             else:
@@ -863,22 +1094,25 @@ class SimpleIndexationGUI:
         self.log("6. Testing website sitemaps...")
         if self.websites_config:
             for website in self.websites_config.get('websites', []):
-                if website.get('enabled', True):
-                    self.log(f"   Testing {website['name']}...")
-                    try:
-                        # Test sitemap URLs
-                        if 'sitemap_url' in website:
-                            self.log(f"      Sitemap: {website['sitemap_url']}")
-                        elif 'sitemap_urls' in website:
-                            for url in website['sitemap_urls']:
-                                self.log(f"      Sitemap: {url}")
+                if not website.get('enabled', True):
+                    continue
 
-                        # Test GSC availability
-                        gsc_status = "GSC enabled" if website.get('gsc_available', False) else "Search fallback"
-                        self.log(f"      Method: {gsc_status}")
+                self.log(f"   Testing {website['name']}...")
+                try:
+                    # Test sitemap URLs
+                    sitemap_url = website.get('sitemap_url')
+                    if sitemap_url is not None:
+                        self.log(f"      Sitemap: {sitemap_url}")
+                    else:
+                        for url in website.get('sitemap_urls', ()):
+                            self.log(f"      Sitemap: {url}")
 
-                    except Exception as e:
-                        self.log(f"      ❌ Error: {e}")
+                    # Test GSC availability
+                    gsc_status = "GSC enabled" if website.get('gsc_available', False) else "Search fallback"
+                    self.log(f"      Method: {gsc_status}")
+
+                except Exception as e:
+                    self.log(f"      ❌ Error: {e}")
 
         self.log("🔧 DIAGNOSTICS COMPLETE!")
         self.log("If you see errors above, that's what needs to be fixed.")
@@ -886,13 +1120,18 @@ class SimpleIndexationGUI:
     def on_closing(self):
         """Handle application closing"""
         try:
-            # Stop console capture
-            if self.console_redirector:
-                self.console_redirector.stop_capture()
+            # Stop log capture
+            if self.log_handler:
+                for name in APP_LOGGERS:
+                    logging.getLogger(name).removeHandler(self.log_handler)
 
-            # Stop scheduler
-            if self.scheduler:
-                self.scheduler.stop_scheduler()
+            # Signal a running check first so it winds down while the scheduler stops
+            self.stop_event.set()
+
+            # Stop scheduler (only if it was ever created). Its thread is a daemon,
+            # so don't hold the window open waiting for it.
+            if self._scheduler:
+                self._scheduler.stop_scheduler(timeout=1)
 
             # Close the application
             self.root.destroy()
@@ -913,15 +1152,12 @@ class WebsiteManagerDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
 
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.dialog.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
-
         self.setup_ui()
         self.load_websites()
 
+        # Center once the widgets are laid out, so the real size is used
+        center_on_parent(self.dialog, parent)
+
     def setup_ui(self):
         """Setup the website manager UI"""
         # Title
@@ -1034,31 +1270,35 @@ class WebsiteManagerDialog:
         # Current editing index
         self.edit_index = None
 
+    @staticmethod
+    def _method_label(website):
+        """Short label for the website's checking method"""
+        get = website.get
+        label = METHOD_DISPLAY.get(get('checking_method', 'auto'))
+        if label:
+            return label
+
+        # auto
+        if get('gsc_available', False):
+            return "Auto(GSC)"
+        elif get('indexed_api_key'):
+            return "Auto(API)"
+        else:
+            return "Auto(Search)"
+
     def load_websites(self):
         """Load websites into the list"""
         self.websites_list.delete(0, tk.END)
-        if hasattr(self.main_app, 'websites_config') and self.main_app.websites_config:
-            for i, website in enumerate(self.main_app.websites_config.get('websites', [])):
+        config = getattr(self.main_app, 'websites_config', None) or {}
+        if config:
+            # Build every row first, then insert them in one call
+            method_label = self._method_label
+            displays = []
+            for website in config.get('websites', []):
                 status = "✓" if website.get('enabled', True) else "✗"
-
-                # Determine method display
-                method = website.get('checking_method', 'auto')
-                if method == 'gsc':
-                    method_display = "GSC"
-                elif method == 'indexed_api':
-                    method_display = "IndexedAPI"
-                elif method == 'google_search':
-                    method_display = "Search"
-                else:  # auto
-                    if website.get('gsc_available', False):
-                        method_display = "Auto(GSC)"
-                    elif website.get('indexed_api_key'):
-                        method_display = "Auto(API)"
-                    else:
-                        method_display = "Auto(Search)"
-
-                display = f"{status} {website['name']} ({method_display})"
-                self.websites_list.insert(tk.END, display)
+                displays.append(f"{status} {website['name']} ({method_label(website)})")
+            if displays:
+                self.websites_list.insert(tk.END, *displays)
 
     def add_website(self):
         """Add new website"""
@@ -1133,7 +1373,7 @@ class WebsiteManagerDialog:
             website_data["indexed_api_key"] = indexed_api_key
 
         # Handle sitemap URLs
-        sitemap_lines = [line.strip() for line in sitemap_content.split('\n') if line.strip()]
+        sitemap_lines = [s for s in (line.strip() for line in sitemap_content.splitlines()) if s]
         if len(sitemap_lines) == 1:
             website_data["sitemap_url"] = sitemap_lines[0]
         else:
@@ -1154,8 +1394,7 @@ class WebsiteManagerDialog:
         """Save configuration to file"""
         try:
             config_path = self.main_app.config_path_var.get()
-            with open(config_path, 'w') as file:
-                json.dump(self.main_app.websites_config, file, indent=2)
+            write_json_file(config_path, self.main_app.websites_config)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save config: {e}")
 
@@ -1173,7 +1412,8 @@ class WebsiteManagerDialog:
 
     def close_dialog(self):
         """Close dialog and reload main app"""
-        self.main_app.load_config()  # Reload in main app
+        # The main app already holds the edited config - just redraw it
+        self.main_app.on_config_reloaded()
         self.dialog.destroy()
 
 class SchedulerDialog:
@@ -1190,15 +1430,12 @@ class SchedulerDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
 
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.dialog.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
-
         self.setup_ui()
         self.load_settings()
 
+        # Center once the widgets are laid out, so the real size is used
+        center_on_parent(self.dialog, parent)
+
     def setup_ui(self):
         """Setup the scheduler UI"""
         # Title
@@ -1253,18 +1490,10 @@ class SchedulerDialog:
         interval_frame.grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=2)
 
         self.interval_type_var = tk.StringVar(value="daily")
-        interval_options = [
-            ("Every __ hours", "hours"),
-            ("Daily", "daily"),
-            ("Weekly", "weekly"),
-            ("Bi-weekly", "biweekly"),
-            ("Monthly", "monthly")
-        ]
-
         self.interval_combo = ttk.Combobox(
             interval_frame,
             textvariable=self.interval_type_var,
-            values=[opt[0] for opt in interval_options],
+            values=list(INTERVAL_TYPE_LABELS.values()),
             state="readonly",
             width=15,
             font=('Trebuchet MS', 9)
@@ -1300,16 +1529,15 @@ class SchedulerDialog:
         self.weekday_frame = tk.Frame(day_frame)
         self.weekday_frame.pack(side='left')
 
-        weekday_options = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         self.weekday_combo = ttk.Combobox(
             self.weekday_frame,
-            values=weekday_options,
+            values=WEEKDAYS,
             state="readonly",
             width=10,
             font=('Trebuchet MS', 9)
         )
         self.weekday_combo.pack(side='left')
-        self.weekday_combo.set("Monday")
+        self.weekday_combo.set(WEEKDAYS[0])
 
         # Day of month selector (for monthly)
         self.monthday_frame = tk.Frame(day_frame)
@@ -1425,33 +1653,23 @@ class SchedulerDialog:
         interval_value = config.get('interval_value', 24)
 
         # Map interval type to combo box
-        type_mapping = {
-            'hours': 'Every __ hours',
-            'daily': 'Daily',
-            'weekly': 'Weekly',
-            'biweekly': 'Bi-weekly',
-            'monthly': 'Monthly'
-        }
-
-        self.interval_type_var.set(type_mapping.get(interval_type, 'Daily'))
+        self.interval_type_var.set(INTERVAL_TYPE_LABELS.get(interval_type, 'Daily'))
         self.interval_value_var.set(str(interval_value))
 
         # Load day settings
         run_day = config.get('run_day', 1)
-        if interval_type in ['weekly', 'biweekly']:
-            weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+        if interval_type in WEEKLY_INTERVAL_TYPES:
             if 1 <= run_day <= 7:
-                self.weekday_combo.set(weekdays[run_day - 1])
+                self.weekday_combo.set(WEEKDAYS[run_day - 1])
         elif interval_type == 'monthly':
             self.day_var.set(str(run_day))
 
         # Parse run time
-        run_time = config.get('run_time', '09:00')
-        try:
-            hour, minute = run_time.split(':')
-            self.hour_var.set(f"{int(hour):02d}")
-            self.minute_var.set(f"{int(minute):02d}")
-        except:
+        parts = str(config.get('run_time', '09:00')).split(':', 1)
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            self.hour_var.set(f"{int(parts[0]):02d}")
+            self.minute_var.set(f"{int(parts[1]):02d}")
+        else:
             self.hour_var.set("09")
             self.minute_var.set("00")
 
@@ -1465,19 +1683,30 @@ class SchedulerDialog:
     def load_websites(self):
         """Load websites into the list"""
         self.websites_listbox.delete(0, tk.END)
-
-        if hasattr(self.main_app, 'websites_config') and self.main_app.websites_config:
-            enabled_websites = self.scheduler.config.get('enabled_websites', [])
-
-            for i, website in enumerate(self.main_app.websites_config.get('websites', [])):
-                if website.get('enabled', True):
-                    status = "GSC" if website.get('gsc_available', False) else "Search"
-                    display = f"{website['name']} ({status})"
-                    self.websites_listbox.insert(tk.END, display)
-
-                    # Auto-select if in enabled list
-                    if website['name'] in enabled_websites:
-                        self.websites_listbox.selection_set(i)
+        self.listed_websites = []  # Website behind each listbox row
+
+        config = getattr(self.main_app, 'websites_config', None) or {}
+        if config:
+            enabled_websites = set(self.scheduler.config.get('enabled_websites', []))
+            websites = [w for w in config.get('websites', []) if w.get('enabled', True)]
+            self.listed_websites = websites
+
+            displays = [
+                f"{website['name']} ({'GSC' if website.get('gsc_available', False) else 'Search'})"
+                for website in websites
+            ]
+            if displays:
+                self.websites_listbox.insert(tk.END, *displays)
+
+            # Auto-select if in enabled list (rows only cover enabled websites)
+            select_listbox_rows(self.websites_listbox,
+                                [row for row, website in enumerate(websites) if website['name'] in enabled_websites])
+
+    def selected_website_names(self):
+        """Names of the websites selected in the list"""
+        websites = self.listed_websites
+        return [websites[index]['name'] for index in self.websites_listbox.curselection()
+                if index < len(websites)]
 
     def select_all_websites(self):
         """Select all websites"""
@@ -1494,20 +1723,20 @@ class SchedulerDialog:
 
     def update_schedule_controls(self):
         """Show/hide controls based on interval type"""
-        interval_type = self.interval_type_var.get()
+        interval_type = INTERVAL_TYPE_BY_LABEL.get(self.interval_type_var.get(), 'daily')
 
         # Hide all controls first
         self.hour_interval_frame.pack_forget()
         self.weekday_frame.pack_forget()
         self.monthday_frame.pack_forget()
 
-        if interval_type == "Every __ hours":
+        if interval_type == 'hours':
             # Show hour interval input
             self.hour_interval_frame.pack(side='left', padx=(5, 0))
-        elif interval_type in ["Weekly", "Bi-weekly"]:
+        elif interval_type in WEEKLY_INTERVAL_TYPES:
             # Show weekday selector
             self.weekday_frame.pack(side='left')
-        elif interval_type == "Monthly":
+        elif interval_type == 'monthly':
             # Show day of month selector
             self.monthday_frame.pack(side='left')
         # Daily doesn't need additional controls
@@ -1530,32 +1759,20 @@ class SchedulerDialog:
                         text=f"Scheduler is ENABLED. Next run: {next_str}",
                         fg='#27ae60'
                     )
-                except:
+                except ValueError:
                     self.status_display.config(
                         text="Scheduler is ENABLED",
                         fg='#27ae60'
                     )
             else:
                 # Generate preview text based on current settings
-                interval_type = self.interval_type_var.get()
-                time_str = f"{self.hour_var.get()}:{self.minute_var.get()}"
-
-                if interval_type == "Every __ hours":
-                    interval_value = self.interval_value_var.get()
-                    preview = f"every {interval_value} hours at {time_str}"
-                elif interval_type == "Daily":
-                    preview = f"daily at {time_str}"
-                elif interval_type == "Weekly":
-                    weekday = self.weekday_combo.get()
-                    preview = f"weekly on {weekday} at {time_str}"
-                elif interval_type == "Bi-weekly":
-                    weekday = self.weekday_combo.get()
-                    preview = f"bi-weekly on {weekday} at {time_str}"
-                elif interval_type == "Monthly":
-                    day = self.day_var.get()
-                    preview = f"monthly on day {day} at {time_str}"
-                else:
-                    preview = f"at {time_str}"
+                preview_format = SCHEDULE_PREVIEW_FORMATS.get(self.interval_type_var.get(), "at {time}")
+                preview = preview_format.format(
+                    time=f"{self.hour_var.get()}:{self.minute_var.get()}",
+                    interval=self.interval_value_var.get(),
+                    weekday=self.weekday_combo.get(),
+                    day=self.day_var.get()
+                )
 
                 self.status_display.config(
                     text=f"Scheduler will run {preview}",
@@ -1571,35 +1788,19 @@ class SchedulerDialog:
         """Save scheduler settings"""
         try:
             # Get selected websites
-            selected_indices = self.websites_listbox.curselection()
-            enabled_websites = []
-
-            for index in selected_indices:
-                if hasattr(self.main_app, 'websites_config') and self.main_app.websites_config:
-                    websites = [w for w in self.main_app.websites_config.get('websites', []) if w.get('enabled', True)]
-                    if index < len(websites):
-                        enabled_websites.append(websites[index]['name'])
+            enabled_websites = self.selected_website_names()
 
             # Convert interval type back to internal format
-            interval_type_map = {
-                'Every __ hours': 'hours',
-                'Daily': 'daily',
-                'Weekly': 'weekly',
-                'Bi-weekly': 'biweekly',
-                'Monthly': 'monthly'
-            }
-
-            interval_type = interval_type_map.get(self.interval_type_var.get(), 'daily')
+            interval_type = INTERVAL_TYPE_BY_LABEL.get(self.interval_type_var.get(), 'daily')
             run_time = f"{self.hour_var.get()}:{self.minute_var.get()}"
 
             # Determine interval value and run day
             if interval_type == 'hours':
                 interval_value = int(self.interval_value_var.get())
                 run_day = 1  # Not used for hourly
-            elif interval_type in ['weekly', 'biweekly']:
+            elif interval_type in WEEKLY_INTERVAL_TYPES:
                 interval_value = 1  # Not used for weekly/biweekly
-                weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                run_day = weekdays.index(self.weekday_combo.get()) + 1
+                run_day = WEEKDAY_INDEX[self.weekday_combo.get()]
             elif interval_type == 'monthly':
                 interval_value = 1  # Not used for monthly
                 run_day = int(self.day_var.get())
@@ -1619,7 +1820,6 @@ class SchedulerDialog:
             )
 
             self.update_status_display()
-            self.main_app.update_scheduler_status()
 
             messagebox.showinfo("Success", "Scheduler settings saved successfully!")
 
@@ -1635,12 +1835,7 @@ class SchedulerDialog:
                 return
 
             # Get selected websites
-            enabled_websites = []
-            for index in selected_indices:
-                if hasattr(self.main_app, 'websites_config') and self.main_app.websites_config:
-                    websites = [w for w in self.main_app.websites_config.get('websites', []) if w.get('enabled', True)]
-                    if index < len(websites):
-                        enabled_websites.append(websites[index]['name'])
+            enabled_websites = self.selected_website_names()
 
             if enabled_websites:
                 self.main_app.log("🧪 TESTING SCHEDULED CHECK...")
@@ -1661,6 +1856,9 @@ class GoogleSheetsSetupDialog:
         self.parent = parent
         self.main_app = main_app
 
+        # Warm up the (slow) gspread/google-auth import while the user reads the dialog
+        threading.Thread(target=prewarm_import, args=('google_sheets_integration',), daemon=True).start()
+
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Google Sheets Setup - Easy Configuration")
@@ -1669,15 +1867,12 @@ class GoogleSheetsSetupDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
 
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.dialog.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
-
         self.setup_ui()
         self.check_current_setup()
 
+        # Center once the widgets are laid out, so the real size is used
+        center_on_parent(self.dialog, parent)
+
     def setup_ui(self):
         """Setup the Google Sheets configuration UI"""
         # Title
@@ -1822,12 +2017,10 @@ class GoogleSheetsSetupDialog:
     def check_current_setup(self):
         """Check if Google Sheets is already configured"""
         try:
-            credentials_path = "config/google_credentials.json"
+            credentials_path = SHEETS_CREDENTIALS_PATH
             if os.path.exists(credentials_path):
                 # Try to load credentials and get service account email
-                with open(credentials_path, 'r') as f:
-                    creds_data = json.load(f)
-                    service_email = creds_data.get('client_email', 'Unknown')
+                service_email = read_service_email(credentials_path)
 
                 self.status_label.config(
                     text=f"✅ Google Sheets is CONFIGURED!\nService Account: {service_email}\n\nYou can now upload results to Google Sheets automatically.",
@@ -1882,12 +2075,14 @@ class GoogleSheetsSetupDialog:
             # Create config directory if it doesn't exist
             os.makedirs("config", exist_ok=True)
 
-            # Copy file to config directory
-            destination = "config/google_credentials.json"
-            import shutil
-            shutil.copy2(source_file, destination)
+            # Write the already-validated credentials to the config directory,
+            # readable by the owner only since the file holds a private key
+            destination = SHEETS_CREDENTIALS_PATH
+            write_json_file(destination, creds_data, mode=0o600)
 
+            # Already parsed above - spare check_current_setup a re-read
             service_email = creds_data.get('client_email', 'Unknown')
+            remember_service_email(destination, service_email)
 
             messagebox.showinfo("Success!",
                 f"✅ Google Sheets credentials uploaded successfully!\n\n"
@@ -1908,11 +2103,9 @@ class GoogleSheetsSetupDialog:
     def test_connection(self):
         """Test Google Sheets connection"""
         try:
-            from google_sheets_integration import GoogleSheetsIntegration
-
             self.main_app.log("🧪 Testing Google Sheets connection...")
 
-            sheets = GoogleSheetsIntegration('config/google_credentials.json')
+            sheets = self.main_app.get_sheets()
 
             if sheets.client:
                 # Try to create a test spreadsheet
@@ -1948,6 +2141,10 @@ class GoogleSheetsSetupDialog:
 
 def main():
     """Main function"""
+    # Scheduled checks run unattended, so console records carry their own timestamp
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s",
+                        datefmt="%Y-%m-%d %H:%M:%S")
+
     # Change to script directory
     os.chdir(Path(__file__).parent)
 
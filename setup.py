@@ -30,8 +30,12 @@ def install_dependencies():
     """Install required packages"""
     print("\n📦 Installing dependencies...")
     import subprocess
+    import sys
+    # Use this interpreter's pip, not whichever pip is first on PATH
+    cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt",
+           "--no-input", "--disable-pip-version-check"]
     try:
-        subprocess.check_call(["pip", "install", "-r", "requirements.txt"])
+        subprocess.run(cmd, check=True)
         print("✅ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError:
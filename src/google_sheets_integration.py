@@ -7,10 +7,78 @@ Automatically uploads indexation results to Google Sheets
 import gspread
 from google.oauth2.service_account import Credentials
 import csv
+import functools
+import itertools
 import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
 import os
 
+logger = logging.getLogger(__name__)
+
+# Retries for Sheets API calls that hit the per-minute quota (HTTP 429)
+# or a transient server error
+API_MAX_RETRIES = 5
+API_MAX_BACKOFF = 60
+API_RETRY_STATUS_CODES = {429, 500, 503}
+
+# Rows sent per append_rows call when streaming a results CSV
+UPLOAD_CHUNK_ROWS = 5000
+
+# A results CSV smaller than this holds at most the header row
+MIN_UPLOAD_BYTES = 32
+LARGE_UPLOAD_BYTES = 100 * 1024 * 1024
+
+# Worksheet names for results files whose base names differ between runs
+WEBSITE_NAME_MAPPING = {
+    'abercrombie': 'Abercrombie Jewelry',
+    'abercrombie_jewelry': 'Abercrombie Jewelry',
+    'austinfence': 'Austin Fence',
+    'austin_fence': 'Austin Fence',
+    'austin_fence_company': 'Austin Fence Company'
+}
+
+def call_with_backoff(func, *args, **kwargs):
+    """Call a Sheets API function, retrying quota (429) and transient 5xx errors with exponential backoff"""
+    for attempt in range(API_MAX_RETRIES + 1):
+        try:
+            return func(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            response = getattr(e, 'response', None)
+            if response is None or response.status_code not in API_RETRY_STATUS_CODES or attempt == API_MAX_RETRIES:
+                raise
+
+            # Honour Retry-After when Google sends it
+            try:
+                backoff = float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                backoff = 2 ** attempt + random.random()
+            backoff = min(backoff, API_MAX_BACKOFF)
+
+            logger.warning("Sheets API HTTP %s - backing off %.1fs (retry %d/%d)",
+                           response.status_code, backoff, attempt + 1, API_MAX_RETRIES)
+            time.sleep(backoff)
+
+def timestamped_rows(reader, timestamp):
+    """
+    Yield [URL, Status, Check_Date] rows to match the worksheet header
+
+    Checker CSVs are URL,Status,Method,Check_Date - the Method column is dropped.
+    Rows without a date get timestamp.
+    """
+    for row in reader:
+        if len(row) >= 4:
+            yield [row[0], row[1], row[3]]
+        elif len(row) == 3:
+            # Historical CSV - URL,Status,Check_Date
+            yield row
+        elif len(row) == 2:
+            yield [row[0], row[1], timestamp]
+
 class GoogleSheetsIntegration:
     def __init__(self, credentials_file=None):
         """
@@ -26,20 +94,25 @@ class GoogleSheetsIntegration:
         """
         self.credentials_file = credentials_file or 'config/google_credentials.json'
         self.client = None
+        # Serializes sheet/worksheet creation when uploading from several threads
+        self.lock = threading.RLock()
+        # Handles reused across uploads - opening by name is a Drive search each time
+        self._spreadsheets = {}
+        self._worksheets = {}
         self.setup_client()
 
     def setup_client(self):
         """Setup Google Sheets client with service account credentials"""
         try:
             if not os.path.exists(self.credentials_file):
-                print(f"ERROR: Credentials file {self.credentials_file} not found.")
-                print("\nSetup Instructions:")
-                print("1. Go to Google Cloud Console (console.cloud.google.com)")
-                print("2. Create a new project or select existing")
-                print("3. Enable Google Sheets API and Google Drive API")
-                print("4. Create Service Account credentials")
-                print("5. Download JSON key file as 'google_credentials.json'")
-                print("6. Share your Google Sheet with the service account email")
+                logger.error("Credentials file %s not found.", self.credentials_file)
+                logger.info("Setup Instructions:")
+                logger.info("1. Go to Google Cloud Console (console.cloud.google.com)")
+                logger.info("2. Create a new project or select existing")
+                logger.info("3. Enable Google Sheets API and Google Drive API")
+                logger.info("4. Create Service Account credentials")
+                logger.info("5. Download JSON key file as 'google_credentials.json'")
+                logger.info("6. Share your Google Sheet with the service account email")
                 return False
 
             # Define the scope
@@ -55,88 +128,108 @@ class GoogleSheetsIntegration:
 
             # Initialize the client
             self.client = gspread.authorize(credentials)
-            print("[OK] Google Sheets client initialized successfully")
+            logger.info("Google Sheets client initialized successfully")
             return True
 
         except Exception as e:
-            print(f"[ERROR] Error setting up Google Sheets client: {e}")
+            logger.error("Error setting up Google Sheets client: %s", e)
             return False
 
     def test_sheet_access(self, spreadsheet_id, worksheet_name=None):
         """Test access to a specific spreadsheet and worksheet"""
         try:
             if not self.client:
-                print("[ERROR] Google Sheets client not initialized")
+                logger.error("Google Sheets client not initialized")
                 return False
 
             # Try to open the spreadsheet by ID
-            spreadsheet = self.client.open_by_key(spreadsheet_id)
-            print(f"[OK] Successfully accessed spreadsheet: {spreadsheet.title}")
+            spreadsheet = call_with_backoff(self.client.open_by_key, spreadsheet_id)
+            logger.info("Successfully accessed spreadsheet: %s", spreadsheet.title)
 
             # If worksheet name is provided, test access to specific worksheet
             if worksheet_name:
                 try:
-                    worksheet = spreadsheet.worksheet(worksheet_name)
-                    print(f"[OK] Successfully accessed worksheet: {worksheet_name}")
+                    worksheet = call_with_backoff(spreadsheet.worksheet, worksheet_name)
+                    logger.info("Successfully accessed worksheet: %s", worksheet_name)
                 except gspread.WorksheetNotFound:
-                    print(f"[WARN] Worksheet '{worksheet_name}' not found, but spreadsheet is accessible")
+                    logger.warning("Worksheet '%s' not found, but spreadsheet is accessible", worksheet_name)
                     # This is still considered success - we can create the worksheet later
                     return True
 
             return True
 
         except gspread.SpreadsheetNotFound:
-            print(f"[ERROR] Spreadsheet with ID '{spreadsheet_id}' not found or not accessible")
+            logger.error("Spreadsheet with ID '%s' not found or not accessible", spreadsheet_id)
             return False
         except gspread.exceptions.APIError as e:
-            print(f"[ERROR] Google Sheets API error: {e}")
+            logger.error("Google Sheets API error: %s", e)
             return False
         except Exception as e:
-            print(f"[ERROR] Error testing sheet access: {e}")
+            logger.error("Error testing sheet access: %s", e)
             return False
 
+    def get_spreadsheet(self, sheet_name, create=True):
+        """Open (or create) a spreadsheet by name, reusing the handle on later calls"""
+        with self.lock:
+            sheet = self._spreadsheets.get(sheet_name)
+            if sheet is None:
+                try:
+                    # Try to open existing sheet
+                    sheet = call_with_backoff(self.client.open, sheet_name)
+                    logger.info("[SHEET] Opened existing sheet: %s", sheet_name)
+                except gspread.SpreadsheetNotFound:
+                    if not create:
+                        raise
+                    # Create new sheet
+                    sheet = call_with_backoff(self.client.create, sheet_name)
+                    logger.info("[SHEET] Created new sheet: %s", sheet_name)
+                self._spreadsheets[sheet_name] = sheet
+            return sheet
+
+    def forget_sheet(self, sheet_name):
+        """Drop cached handles for a spreadsheet (e.g. after it errors)"""
+        with self.lock:
+            self._spreadsheets.pop(sheet_name, None)
+            for key in [key for key in self._worksheets if key[0] == sheet_name]:
+                del self._worksheets[key]
+
     def get_or_create_sheet(self, sheet_name, website_name):
         """Get existing sheet or create new one"""
-        try:
-            # Try to open existing sheet
-            sheet = self.client.open(sheet_name)
-            print(f"[SHEET] Opened existing sheet: {sheet_name}")
-        except gspread.SpreadsheetNotFound:
-            # Create new sheet
-            sheet = self.client.create(sheet_name)
-            print(f"[SHEET] Created new sheet: {sheet_name}")
+        with self.lock:
+            worksheet = self._worksheets.get((sheet_name, website_name))
+            if worksheet is None:
+                worksheet = self._get_or_create_sheet(sheet_name, website_name)
+                self._worksheets[(sheet_name, website_name)] = worksheet
+            return worksheet
+
+    def _get_or_create_sheet(self, sheet_name, website_name):
+        sheet = self.get_spreadsheet(sheet_name)
 
         # Get or create worksheet for this website
         try:
-            worksheet = sheet.worksheet(website_name)
+            worksheet = call_with_backoff(sheet.worksheet, website_name)
         except gspread.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(title=website_name, rows=1000, cols=10)
+            worksheet = call_with_backoff(sheet.add_worksheet, title=website_name, rows=1000, cols=10)
             # Add headers
-            worksheet.append_row(['URL', 'Status', 'Check_Date'])
-            print(f"[NEW] Created new worksheet: {website_name}")
+            call_with_backoff(worksheet.append_row, ['URL', 'Status', 'Check_Date'])
+            logger.info("[NEW] Created new worksheet: %s", website_name)
 
         return worksheet
 
-    def normalize_website_name(self, filename):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def normalize_website_name(filename):
         """Normalize website names to prevent duplicate tabs"""
         # Extract base name from filename
         base_name = filename.split('_indexation')[0].lower()
 
-        # Mapping for consistent naming
-        name_mapping = {
-            'abercrombie': 'Abercrombie Jewelry',
-            'abercrombie_jewelry': 'Abercrombie Jewelry',
-            'austinfence': 'Austin Fence',
-            'austin_fence': 'Austin Fence',
-            'austin_fence_company': 'Austin Fence Company'
-        }
-
-        return name_mapping.get(base_name, base_name.replace('_', ' ').title())
+        mapped = WEBSITE_NAME_MAPPING.get(base_name)
+        return mapped if mapped is not None else base_name.replace('_', ' ').title()
 
     def upload_results(self, csv_file_path, sheet_name=None, website_name=None):
         """Upload CSV results to Google Sheets"""
         if not self.client:
-            print("[ERROR] Google Sheets client not initialized")
+            logger.error("Google Sheets client not initialized")
             return False
 
         try:
@@ -149,128 +242,148 @@ class GoogleSheetsIntegration:
             if not sheet_name:
                 sheet_name = "Website Indexation Results"
 
-            # Get worksheet
-            worksheet = self.get_or_create_sheet(sheet_name, website_name)
-
-            # Read CSV data
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                rows = list(reader)
-
-            if len(rows) <= 1:  # Only header or empty
-                print(f"[WARN]  No data to upload from {csv_file_path}")
+            # Skip header-only/empty files before touching the sheet
+            file_size = os.path.getsize(csv_file_path)
+            if file_size < MIN_UPLOAD_BYTES:
+                logger.warning("No data to upload from %s", csv_file_path)
                 return False
+            if file_size > LARGE_UPLOAD_BYTES:
+                logger.info("Large results file (%.0f MB) - uploading in chunks of %d rows",
+                            file_size / (1024 * 1024), UPLOAD_CHUNK_ROWS)
 
-            # Skip header row when appending (it already exists in sheet)
-            data_rows = rows[1:]
+            # Get worksheet
+            worksheet = self.get_or_create_sheet(sheet_name, website_name)
 
             # Get current timestamp for this batch
             batch_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            # Check if this is a single-date CSV (like from latest results)
-            # or historical CSV (already has dates)
-            if len(data_rows) > 0 and len(data_rows[0]) >= 3:
-                # Has date column, upload as-is
-                worksheet.append_rows(data_rows)
-                print(f"[OK] Uploaded {len(data_rows)} rows to {website_name} worksheet")
-            else:
-                # Add timestamp to rows without dates
-                timestamped_rows = []
-                for row in data_rows:
-                    if len(row) >= 2:
-                        timestamped_rows.append([row[0], row[1], batch_timestamp])
-
-                worksheet.append_rows(timestamped_rows)
-                print(f"[OK] Uploaded {len(timestamped_rows)} rows with timestamp to {website_name} worksheet")
+            # Stream the CSV in chunks instead of loading the whole file
+            uploaded = 0
+            with open(csv_file_path, 'r', encoding='utf-8', newline='') as file:
+                reader = csv.reader(file)
+                # Skip header row when appending (it already exists in sheet)
+                next(reader, None)
+
+                rows = timestamped_rows(reader, batch_timestamp)
+                while True:
+                    chunk = list(itertools.islice(rows, UPLOAD_CHUNK_ROWS))
+                    if not chunk:
+                        break
+                    call_with_backoff(worksheet.append_rows, chunk)
+                    uploaded += len(chunk)
+
+            if not uploaded:  # Only header or empty
+                logger.warning("No data to upload from %s", csv_file_path)
+                return False
 
+            logger.info("Uploaded %d rows to %s worksheet", uploaded, website_name)
             return True
 
         except Exception as e:
-            print(f"[ERROR] Error uploading to Google Sheets: {e}")
+            logger.error("Error uploading to Google Sheets: %s", e)
+            # The sheet may have been deleted or renamed - look it up again next time
+            self.forget_sheet(sheet_name or "Website Indexation Results")
             return False
 
     def create_summary_sheet(self, sheet_name="Website Indexation Results"):
         """Create a summary sheet with overview data"""
         try:
-            sheet = self.client.open(sheet_name)
+            sheet = self.get_spreadsheet(sheet_name, create=False)
 
-            # Create or get summary worksheet
-            try:
-                summary_ws = sheet.worksheet("Summary")
-            except gspread.WorksheetNotFound:
-                summary_ws = sheet.add_worksheet(title="Summary", rows=100, cols=10)
+            # One metadata request gives both the Summary tab and the website tabs
+            worksheets = call_with_backoff(sheet.worksheets)
+            summary_ws = next((ws for ws in worksheets if ws.title == "Summary"), None)
+            titles = [ws.title for ws in worksheets if ws.title != "Summary"]
+
+            # Create summary worksheet if needed
+            if summary_ws is None:
+                summary_ws = call_with_backoff(sheet.add_worksheet, title="Summary", rows=100, cols=10)
                 # Add headers
-                summary_ws.append_row([
+                call_with_backoff(summary_ws.append_row, [
                     'Website', 'Total URLs', 'Indexed', 'Not Indexed',
                     'Indexation Rate', 'Last Updated'
                 ])
 
-            # Get all worksheets (except Summary)
-            worksheets = [ws for ws in sheet.worksheets() if ws.title != "Summary"]
+            # Read every website's rows in one request. Columns A:D, because tabs
+            # filled by older uploads also hold a Method column before Check_Date
+            value_ranges = []
+            if titles:
+                ranges = ["'{}'!A:D".format(title.replace("'", "''")) for title in titles]
+                value_ranges = call_with_backoff(sheet.values_batch_get, ranges).get('valueRanges', [])
 
             summary_data = []
-            for ws in worksheets:
+            for title, value_range in zip(titles, value_ranges):
                 try:
                     # Get latest data for this website
-                    all_values = ws.get_all_values()
+                    all_values = value_range.get('values', [])
                     if len(all_values) <= 1:  # Only header
                         continue
 
-                    # Find most recent check date
-                    latest_date = None
-                    latest_data = []
-
+                    # Tally rows per check date in one pass: [total, indexed, not indexed]
+                    buckets = defaultdict(lambda: [0, 0, 0])
                     for row in all_values[1:]:  # Skip header
-                        if len(row) >= 3:
-                            check_date = row[2]
-                            if latest_date is None or check_date > latest_date:
-                                if check_date != latest_date:
-                                    latest_date = check_date
-                                    latest_data = []
-                                latest_data.append(row)
-                            elif check_date == latest_date:
-                                latest_data.append(row)
-
-                    if latest_data:
-                        total = len(latest_data)
-                        indexed = sum(1 for row in latest_data if 'INDEXED' in row[1])
-                        not_indexed = sum(1 for row in latest_data if 'NOT INDEXED' in row[1])
+                        if len(row) < 3:
+                            continue
+                        # Check_Date is always the last column of a row
+                        bucket = buckets[row[-1]]
+                        status = row[1]
+                        bucket[0] += 1
+                        bucket[1] += status == 'INDEXED'
+                        bucket[2] += status == 'NOT INDEXED'
+
+                    # Parse each distinct date once; rows with malformed dates are skipped
+                    # rather than winning the string comparison
+                    dated = {}
+                    for check_date, counts in buckets.items():
+                        try:
+                            parsed = datetime.fromisoformat(check_date.strip())
+                        except ValueError:
+                            continue
+                        merged = dated.setdefault(parsed, [0, 0, 0])
+                        for i, count in enumerate(counts):
+                            merged[i] += count
+
+                    # Summarize the most recent check
+                    if dated:
+                        latest = max(dated)
+                        total, indexed, not_indexed = dated[latest]
+                        latest_date = latest.strftime("%Y-%m-%d %H:%M:%S")
                         rate = f"{(indexed/total*100):.1f}%" if total > 0 else "0%"
 
                         summary_data.append([
-                            ws.title, total, indexed, not_indexed, rate, latest_date
+                            title, total, indexed, not_indexed, rate, latest_date
                         ])
 
                 except Exception as e:
-                    print(f"[WARN]  Error processing worksheet {ws.title}: {e}")
+                    logger.warning("Error processing worksheet %s: %s", title, e)
 
             if summary_data:
-                # Clear existing summary data (keep headers)
-                summary_ws.clear()
-                summary_ws.append_row([
+                # Rewrite the summary (headers + rows) in a single append
+                call_with_backoff(summary_ws.clear)
+                call_with_backoff(summary_ws.append_rows, [[
                     'Website', 'Total URLs', 'Indexed', 'Not Indexed',
                     'Indexation Rate', 'Last Updated'
-                ])
-                summary_ws.append_rows(summary_data)
-                print(f"[OK] Updated summary sheet with {len(summary_data)} websites")
+                ]] + summary_data)
+                logger.info("Updated summary sheet with %d websites", len(summary_data))
 
             return True
 
         except Exception as e:
-            print(f"[ERROR] Error creating summary sheet: {e}")
+            logger.error("Error creating summary sheet: %s", e)
+            self.forget_sheet(sheet_name)
             return False
 
-def main():
-    """Example usage"""
+def main(results_dir='.', sheet_name="Website Indexation Results", credentials_file=None):
+    """Upload every results CSV in results_dir and refresh the summary sheet"""
     # Initialize integration
-    sheets = GoogleSheetsIntegration()
+    sheets = GoogleSheetsIntegration(credentials_file)
 
     if not sheets.client:
         print("Cannot proceed without Google Sheets access")
         return
 
     # Look for CSV files to upload
-    csv_files = [f for f in os.listdir('.') if f.endswith('_indexation_results.csv')]
+    csv_files = [f for f in os.listdir(results_dir) if f.endswith('_indexation_results.csv')]
 
     if not csv_files:
         print("No indexation results CSV files found")
@@ -283,13 +396,14 @@ def main():
     # Upload each file
     for csv_file in csv_files:
         print(f"\nUploading {csv_file}...")
-        sheets.upload_results(csv_file)
+        sheets.upload_results(os.path.join(results_dir, csv_file), sheet_name)
 
     # Create summary
     print("\nCreating summary sheet...")
-    sheets.create_summary_sheet()
+    sheets.create_summary_sheet(sheet_name)
 
     print("\n[OK] All done! Check your Google Sheets.")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
\ No newline at end of file
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Tk helpers shared by the indexation GUIs
+"""
+
+def select_listbox_rows(listbox, indices):
+    """Select rows in a listbox, one selection_set call per contiguous run"""
+    start = prev = None
+    for index in indices:
+        if prev is not None and index == prev + 1:
+            prev = index
+            continue
+        if start is not None:
+            listbox.selection_set(start, prev)
+        start = prev = index
+    if start is not None:
+        listbox.selection_set(start, prev)
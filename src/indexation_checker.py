@@ -8,8 +8,19 @@ falls back to Google search for other sites.
 import requests
 import time
 import csv
+import functools
+import gzip
+import io
+import itertools
 import json
-from urllib.parse import quote_plus
+import logging
+import operator
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
+from urllib.parse import quote_plus, urlparse
 import sys
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
@@ -18,8 +29,350 @@ import os
 # Import our checkers
 from search_console_checker import SearchConsoleChecker
 from indexed_api_checker import IndexedAPIChecker
+from result_cache import ResultCache
+
+# orjson is an optional speedup for config parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# lxml is an optional speedup for sitemap parsing
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# Result statuses - plain strings, because they're written as-is to the CSVs,
+# the result cache and Sheets. Compare against these, never by substring.
+STATUS_INDEXED = 'INDEXED'
+STATUS_NOT_INDEXED = 'NOT INDEXED'
+STATUS_RATE_LIMITED = 'RATE LIMITED'
+STATUS_ERROR = 'ERROR'
+
+# Results younger than this are reused instead of re-checked (per-site `cache_ttl_hours`).
+# Off by default - a TTL as long as the schedule interval would replay the previous run
+DEFAULT_CACHE_TTL_HOURS = 0
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes that are worth retrying with backoff
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Google search fallback: concurrent lookups, and the minimum gap between
+# request starts so the combined rate stays polite
+GOOGLE_SEARCH_WORKERS = 4
+GOOGLE_SEARCH_HOST = 'www.google.com'
+GOOGLE_SEARCH_MIN_INTERVAL = 1.5
+
+GOOGLE_SEARCH_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+GOOGLE_SEARCH_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Progress lines from the Google search fallback: every N URLs, or after this
+# many seconds without one
+PROGRESS_LOG_EVERY = 50
+PROGRESS_LOG_SECONDS = 10
+
+# Extra cooldown for the search host after a request is rate limited anyway
+RATE_LIMIT_COOLDOWN = 10
+
+# Sub-sitemaps of a sitemap index downloaded at once, overall and per host
+SITEMAP_FETCH_WORKERS = 8
+SITEMAP_FETCHES_PER_HOST = 4
+
+# Sitemaps downloaded this recently are reused without even a conditional request
+SITEMAP_FRESH_SECONDS = 3600
+
+# Seconds to wait for a sitemap server to connect or send more of the body
+SITEMAP_TIMEOUT = 30
+
+# User-Agent sent with sitemap requests
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Service-account key used for the Search Console API
+GSC_CREDENTIALS_PATH = 'config/google_credentials.json'
+
+# Results CSV layout - result dict keys and their column titles
+CSV_FIELDS = ['url', 'status', 'method', 'check_date']
+CSV_HEADER = ['URL', 'Status', 'Method', 'Check_Date']
+CSV_ROW = operator.itemgetter(*CSV_FIELDS)
+CSV_WRITE_BUFFER = 1 << 20
+
+# Leading bytes of a gzip stream
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Google's "no results" and "unusual traffic" (captcha) markers, matched in one
+# pass over the raw bytes to skip decoding the page
+SEARCH_PAGE_MARKERS_RE = re.compile(
+    rb"(?P<no_results>did not match any documents|No results found)"
+    rb"|(?P<blocked>unusual traffic from your computer network)"
+)
+
+class CheckCancelled(BaseException):
+    """
+    Raised at a network boundary once the stop event is set.
+
+    Derives from BaseException (like asyncio.CancelledError) so the
+    broad `except Exception` handlers around fetches don't swallow it.
+    """
+
+def pause(seconds, stop_event=None):
+    """Sleep for up to `seconds`, returning True early if the stop event is set"""
+    if stop_event is None:
+        time.sleep(seconds)
+        return False
+    return stop_event.wait(seconds)
+
+def raise_if_cancelled(stop_event):
+    """Abort the current check if the stop event is set"""
+    if stop_event is not None and stop_event.is_set():
+        raise CheckCancelled()
+
+class HostLimiter:
+    """
+    Per-host request limiter with exponential backoff.
 
-def fetch_urls_from_sitemap_index(sitemap_index_url, exclude_sitemaps=None):
+    Caps concurrent requests per host with a semaphore, spaces request
+    starts by an optional per-host minimum interval, honours rate-limit
+    response headers (Retry-After / X-RateLimit-*) and retries 429/5xx
+    responses with exponential backoff. Requests share one keep-alive
+    session so connections and TLS sessions are reused across threads.
+    """
+
+    def __init__(self, max_concurrent=10, max_retries=5, max_backoff=60):
+        self.max_concurrent = max_concurrent
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.session = requests.Session()
+        # Keep enough pooled connections per host for max_concurrent threads
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=max_concurrent)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _host_state(self, url):
+        """Get (or create) the limiter state for the URL's host"""
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = {
+                    'semaphore': threading.Semaphore(self.max_concurrent),
+                    'remaining': None,
+                    'next_allowed': 0.0,
+                    'min_interval': 0.0
+                }
+                self._hosts[host] = state
+            return state
+
+    def set_min_interval(self, url, seconds):
+        """Require at least `seconds` between request starts to the URL's host"""
+        self._host_state(url)['min_interval'] = seconds
+
+    def cool_down(self, url, seconds):
+        """Hold off all requests to the URL's host for `seconds`"""
+        state = self._host_state(url)
+        with self._lock:
+            state['next_allowed'] = max(state['next_allowed'], time.monotonic() + seconds)
+
+    @contextmanager
+    def for_host(self, url, stop_event=None):
+        """Hold a request slot for the URL's host, waiting out any cooldown"""
+        state = self._host_state(url)
+        with state['semaphore']:
+            # Reserve a start time so concurrent callers queue up min_interval apart
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, state['next_allowed'])
+                if state['min_interval']:
+                    state['next_allowed'] = start + state['min_interval']
+            delay = start - now
+            if delay > 0 and pause(delay, stop_event):
+                raise CheckCancelled()
+            yield state
+
+    def update_from_response(self, state, response):
+        """Record rate-limit headers so later requests to the host wait as asked"""
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            try:
+                state['remaining'] = int(remaining)
+            except ValueError:
+                state['remaining'] = None
+
+        wait = None
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                wait = None
+        elif state['remaining'] == 0:
+            reset = headers.get('X-RateLimit-Reset')
+            try:
+                wait = float(reset) if reset is not None else None
+            except ValueError:
+                wait = None
+            # Some APIs send an epoch timestamp rather than seconds to wait
+            if wait is not None and wait > time.time() - 1:
+                wait = wait - time.time()
+
+        if wait is not None and wait > 0:
+            with self._lock:
+                state['next_allowed'] = max(state['next_allowed'],
+                                            time.monotonic() + min(wait, self.max_backoff))
+
+    def get(self, url, stop_event=None, **kwargs):
+        """
+        GET a URL through the limiter, retrying 429/5xx with exponential backoff
+
+        Raises CheckCancelled if stop_event is set before a request is sent
+        or while waiting out a cooldown/backoff.
+        """
+        for attempt in range(self.max_retries + 1):
+            raise_if_cancelled(stop_event)
+            with self.for_host(url, stop_event) as state:
+                response = self.session.get(url, **kwargs)
+                self.update_from_response(state, response)
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            # Hand the connection back to the pool (matters for stream=True)
+            response.close()
+
+            backoff = min(2 ** attempt + random.random(), self.max_backoff)
+            logger.warning("HTTP %s from %s - rate limiting, backing off %.1fs (retry %d/%d)",
+                           response.status_code, urlparse(url).netloc, backoff, attempt + 1, self.max_retries)
+            if pause(backoff, stop_event):
+                raise CheckCancelled()
+
+        return response
+
+# Shared limiter for all outbound requests made by the checker
+host_limiter = HostLimiter()
+# Default for sitemap fetches - Google search requests send their own rotating agent
+host_limiter.session.headers['User-Agent'] = DEFAULT_USER_AGENT
+host_limiter.set_min_interval(f"https://{GOOGLE_SEARCH_HOST}/", GOOGLE_SEARCH_MIN_INTERVAL)
+
+# Shuffled once, then rotated in order - next() on a cycle is atomic across threads
+_user_agent_cycle = itertools.cycle(random.sample(GOOGLE_SEARCH_USER_AGENTS, k=len(GOOGLE_SEARCH_USER_AGENTS)))
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+def get_result_cache():
+    """Get the shared result cache, or None if it can't be opened"""
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            try:
+                _result_cache = ResultCache()
+            except Exception as e:
+                logger.warning("Result cache unavailable: %s", e)
+                _result_cache = False
+        return _result_cache or None
+
+def iter_sitemap_locs(response):
+    """
+    Yield the <loc> of each entry in a sitemap or sitemap index.
+
+    Parses the streamed response incrementally and discards each entry once
+    read, so memory stays flat however large the sitemap is. iterparse's C
+    tree builder beats a pure-Python SAX/expat handler here - the handler
+    pays a Python call per start, end and text event.
+    """
+    # Let urllib3 undo Content-Encoding: gzip/deflate while we read
+    response.raw.decode_content = True
+    source = io.BufferedReader(response.raw)
+
+    # .xml.gz sitemaps are usually served as plain gzip files, with no
+    # Content-Encoding - spot them by their magic bytes
+    if source.peek(2)[:2] == GZIP_MAGIC:
+        source = gzip.GzipFile(fileobj=source)
+
+    iterparse = lxml_etree.iterparse if lxml_etree is not None else ET.iterparse
+
+    depth = 0
+    root = None
+    loc_tag = None
+    for event, elem in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if root is None:
+                root = elem
+                # <loc> lives in the root's (sitemap) namespace, so one exact
+                # tag compare replaces endswith() and ignores <image:loc> etc.
+                namespace = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''
+                loc_tag = namespace + 'loc'
+            continue
+
+        depth -= 1
+        # Only <loc> directly under <url>/<sitemap>
+        if depth == 2 and elem.tag == loc_tag and elem.text:
+            yield elem.text.strip()
+        elif depth == 1:
+            # Finished one <url>/<sitemap> entry - drop it from the tree
+            root.clear()
+
+def fetch_sitemap_locs(sitemap_url, stop_event=None):
+    """
+    Download a sitemap (or sitemap index) and return its <loc> entries.
+
+    A sitemap downloaded within SITEMAP_FRESH_SECONDS is reused without a
+    request. Older copies are revalidated with the validators from the last
+    download, so an unchanged sitemap costs a 304 instead of the full body.
+    """
+    result_cache = get_result_cache()
+    cached = result_cache.get_sitemap(sitemap_url) if result_cache else None
+
+    headers = {}
+    if cached:
+        etag, last_modified, locs, fetched_at = cached
+        if time.time() - fetched_at < SITEMAP_FRESH_SECONDS:
+            logger.info("[CACHE] Sitemap fetched recently: %s", sitemap_url)
+            return locs
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = host_limiter.get(sitemap_url, stop_event=stop_event, headers=headers, stream=True,
+                                timeout=SITEMAP_TIMEOUT)
+    with closing(response):
+        if response.status_code == 304 and cached:
+            logger.info("[CACHE] Sitemap unchanged: %s", sitemap_url)
+            locs = cached[2]
+        else:
+            response.raise_for_status()
+            locs = list(iter_sitemap_locs(response))
+        etag = response.headers.get('ETag') or (cached[0] if cached else None)
+        last_modified = response.headers.get('Last-Modified') or (cached[1] if cached else None)
+
+    # Stored even without validators - it still serves the freshness window
+    if result_cache:
+        result_cache.store_sitemap(sitemap_url, etag, last_modified, locs)
+    return locs
+
+@functools.lru_cache(maxsize=64)
+def exclude_pattern(exclude_sitemaps):
+    """Compile a website's exclude_sitemaps substrings into one regex, once per config"""
+    return re.compile('|'.join(map(re.escape, exclude_sitemaps)))
+
+def fetch_urls_from_sitemap_index(sitemap_index_url, exclude_sitemaps=None, stop_event=None):
     """
     Fetch URLs from a sitemap index XML file that contains references to other sitemaps.
     Returns a list of URLs.
@@ -28,117 +381,149 @@ def fetch_urls_from_sitemap_index(sitemap_index_url, exclude_sitemaps=None):
         exclude_sitemaps = []
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-        response = requests.get(sitemap_index_url, headers=headers)
-        response.raise_for_status()
+        # One pattern for all exclusions instead of scanning the list per sitemap
+        exclude_re = exclude_pattern(tuple(exclude_sitemaps)) if exclude_sitemaps else None
 
-        # Parse XML to find individual sitemaps
-        root = ET.fromstring(response.content)
+        # Parse XML to find individual sitemaps (each shard fetched once,
+        # even if the index lists it twice)
         sitemap_urls = []
+        for sitemap_url in dict.fromkeys(fetch_sitemap_locs(sitemap_index_url, stop_event)):
+            # Check if this sitemap should be excluded
+            if exclude_re and exclude_re.search(sitemap_url):
+                continue
+            sitemap_urls.append(sitemap_url)
+
+        logger.info("Found %d sitemaps in index", len(sitemap_urls))
+
+        # Shards are often spread over a CDN and the main host - cap how many
+        # run against any one origin so the pool doesn't hammer a single server
+        host_slots = {
+            host: threading.Semaphore(SITEMAP_FETCHES_PER_HOST)
+            for host in {urlparse(sitemap_url).netloc for sitemap_url in sitemap_urls}
+        }
 
-        for elem in root:
-            for child in elem:
-                if child.tag.endswith('loc'):
-                    sitemap_url = child.text
-                    # Check if this sitemap should be excluded
-                    should_exclude = any(exclude in sitemap_url for exclude in exclude_sitemaps)
-                    if not should_exclude:
-                        sitemap_urls.append(sitemap_url)
-
-        print(f"  Found {len(sitemap_urls)} sitemaps in index")
+        def fetch_one(sitemap_url):
+            with host_slots[urlparse(sitemap_url).netloc]:
+                logger.info("Processing sitemap: %s", sitemap_url)
+                return fetch_urls_from_sitemap(sitemap_url, stop_event)
 
-        # Fetch URLs from each individual sitemap
-        all_urls = []
-        for sitemap_url in sitemap_urls:
-            print(f"  Processing sitemap: {sitemap_url}")
-            sitemap_urls_batch = fetch_urls_from_sitemap(sitemap_url)
-            all_urls.extend(sitemap_urls_batch)
-            time.sleep(1)  # Be polite
+        # Fetch the individual sitemaps concurrently - the host limiter
+        # handles per-host backoff, and map() keeps the sitemap order
+        # Products often appear in several shards - keep the first sighting only
+        all_urls = {}
+        with ThreadPoolExecutor(max_workers=SITEMAP_FETCH_WORKERS) as executor:
+            for sitemap_urls_batch in executor.map(fetch_one, sitemap_urls):
+                all_urls.update(dict.fromkeys(sitemap_urls_batch))
 
-        return all_urls
+        return list(all_urls)
 
     except Exception as e:
-        print(f"Error fetching sitemap index: {e}")
+        logger.error("Error fetching sitemap index: %s", e)
         return []
 
-def fetch_urls_from_sitemap(sitemap_url):
+def fetch_urls_from_sitemap(sitemap_url, stop_event=None):
     """
     Fetch URLs from a single sitemap XML file.
     Returns a list of URLs.
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-        response = requests.get(sitemap_url, headers=headers)
-        response.raise_for_status()
-
-        # Parse XML to find URLs
-        root = ET.fromstring(response.content)
-        urls = []
-
-        for elem in root:
-            for child in elem:
-                if child.tag.endswith('loc'):
-                    urls.append(child.text)
-
-        return urls
+        return fetch_sitemap_locs(sitemap_url, stop_event)
 
     except Exception as e:
-        print(f"Error fetching sitemap {sitemap_url}: {e}")
+        logger.error("Error fetching sitemap %s: %s", sitemap_url, e)
         return []
 
-def check_indexation_google_search(url):
+def check_indexation_google_search(url, stop_event=None):
     """
     Check if a URL is indexed using Google search (fallback method)
     """
-    import random
-
-    # Rotate user agents to avoid detection
-    user_agents = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    ]
-
     try:
         search_query = f"site:{url}"
-        search_url = f"https://www.google.com/search?q={quote_plus(search_query)}"
-
-        headers = {
-            'User-Agent': random.choice(user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        search_url = f"https://{GOOGLE_SEARCH_HOST}/search?q={quote_plus(search_query)}"
 
-        response = requests.get(search_url, headers=headers, timeout=10)
+        # Rotate user agents to avoid detection
+        headers = dict(GOOGLE_SEARCH_HEADERS)
+        headers['User-Agent'] = next(_user_agent_cycle)
+
+        response = host_limiter.get(search_url, stop_event=stop_event, headers=headers, timeout=10)
 
         if response.status_code == 200:
-            if "did not match any documents" in response.text or "No results found" in response.text:
-                return "NOT INDEXED", "Google Search"
-            else:
-                return "INDEXED", "Google Search"
+            marker = SEARCH_PAGE_MARKERS_RE.search(response.content)
+            if marker and marker.lastgroup == 'no_results':
+                return STATUS_NOT_INDEXED, "Google Search"
+            # A captcha page has no "no results" text either - don't count it as indexed
+            if marker or '/sorry/' in response.url:
+                logger.warning("Google served a captcha for %s - need longer delays", url)
+                return STATUS_RATE_LIMITED, "Google Search (captcha)"
+            return STATUS_INDEXED, "Google Search"
         elif response.status_code == 429:
-            print(f"    Rate limited for {url} - need longer delays")
-            return "RATE LIMITED", f"Google Search (HTTP {response.status_code})"
+            logger.warning("Rate limited for %s - need longer delays", url)
+            return STATUS_RATE_LIMITED, f"Google Search (HTTP {response.status_code})"
         else:
-            print(f"    HTTP {response.status_code} for {url}")
-            return "ERROR", f"Google Search (HTTP {response.status_code})"
+            logger.error("HTTP %s for %s", response.status_code, url)
+            return STATUS_ERROR, f"Google Search (HTTP {response.status_code})"
 
     except Exception as e:
-        print(f"    Exception for {url}: {str(e)}")
-        return "ERROR", f"Google Search ({str(e)})"
+        logger.error("Exception for %s: %s", url, e)
+        return STATUS_ERROR, f"Google Search ({str(e)})"
+
+def check_urls_google_search(urls, stop_event=None):
+    """
+    Check URLs with the Google search fallback, several at a time
+
+    Request pacing is left to host_limiter, so workers only wait on the
+    network. Stops early (keeping finished results) if stop_event is set.
+
+    Returns:
+        List of result dicts in the same order as urls
+    """
+    results = [None] * len(urls)
+    done = 0
+    last_progress = time.monotonic()
+    # One timestamp for the whole batch, so the sheet summary sees one check
+    check_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def check_one(url):
+        status, method = check_indexation_google_search(url, stop_event)
+        if status == STATUS_RATE_LIMITED:
+            logger.warning("Rate limited! Taking longer break...")
+            host_limiter.cool_down(f"https://{GOOGLE_SEARCH_HOST}/", RATE_LIMIT_COOLDOWN)
+        return {
+            'url': url,
+            'status': status,
+            'method': method,
+            'check_date': check_date
+        }
+
+    futures = {}
+    executor = ThreadPoolExecutor(max_workers=GOOGLE_SEARCH_WORKERS)
+    try:
+        futures = {executor.submit(check_one, url): i for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except CheckCancelled:
+                logger.info("[STOP] Check stopped by user after processing %d/%d URLs", done, len(urls))
+                break
+            results[futures[future]] = result
+            done += 1
+
+            # Progress every PROGRESS_LOG_EVERY URLs (or PROGRESS_LOG_SECONDS), not per URL
+            now = time.monotonic()
+            if done % PROGRESS_LOG_EVERY == 0 or done == len(urls) or now - last_progress >= PROGRESS_LOG_SECONDS:
+                logger.info("Checked %d/%d URLs", done, len(urls))
+                last_progress = now
+            else:
+                logger.debug("Checked %d/%d: %s", done, len(urls), result['url'])
+    finally:
+        # Drop anything not started yet; running lookups see the stop event
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
 
+    return [result for result in results if result is not None]
+
+@functools.lru_cache(maxsize=1024)
 def normalize_website_url(url):
     """Normalize website URL for Search Console property matching"""
     if not url.startswith(('http://', 'https://')):
@@ -147,116 +532,209 @@ def normalize_website_url(url):
         url += '/'
     return url
 
+@functools.lru_cache(maxsize=1024)
 def get_base_domain(url):
     """Extract base domain from URL"""
-    from urllib.parse import urlparse
     parsed = urlparse(url)
     return parsed.netloc
 
-def check_website_indexation(website_config, stop_event=None):
+@functools.lru_cache(maxsize=8)
+def gsc_property_index(gsc_properties):
+    """Map each property's domain to its URL (first wins) - built once per property list"""
+    prop_domains = {}
+    for prop_url in gsc_properties:
+        # Domain properties look like 'sc-domain:example.com' and have no netloc
+        if prop_url.startswith('sc-domain:'):
+            prop_domain = prop_url[len('sc-domain:'):]
+        else:
+            prop_domain = get_base_domain(prop_url)
+        if prop_domain:
+            prop_domains.setdefault(prop_domain, prop_url)
+    return prop_domains
+
+def find_gsc_property(website_domain, gsc_properties):
+    """Find the GSC property covering a domain - exact match first, then partial"""
+    prop_domains = gsc_property_index(tuple(gsc_properties))
+    if website_domain in prop_domains:
+        return prop_domains[website_domain]
+
+    for prop_domain, prop_url in prop_domains.items():
+        if website_domain in prop_domain or prop_domain in website_domain:
+            return prop_url
+    return None
+
+def is_indexed_status(status):
+    """True for an indexed status - every checker reports exactly 'INDEXED'"""
+    return status == STATUS_INDEXED
+
+def mark_indexed(results):
+    """Classify each result's status once, so callers can count with a plain bool"""
+    for result in results:
+        result['is_indexed'] = is_indexed_status(result['status'])
+    return results
+
+def create_gsc_checker():
+    """
+    Build a Search Console checker from the default credentials.
+
+    Runs normally share a LazyGSC instead, so auth and the property list
+    happen at most once and only when a site needs them. The underlying API
+    client isn't thread-safe, so concurrent checks should each use their own.
+    """
+    return SearchConsoleChecker(GSC_CREDENTIALS_PATH)
+
+def list_gsc_properties(gsc_checker):
+    """
+    Get the property URLs a checker can see, or None if GSC isn't available.
+
+    The list is plain data, so it can be shared by concurrent checks even
+    though each of them needs its own checker.
+    """
+    if gsc_checker.service is None:
+        return None
+    gsc_properties = [prop['url'] for prop in gsc_checker.get_properties()]
+    logger.info("GSC Properties available: %d", len(gsc_properties))
+    return gsc_properties
+
+class LazyGSC:
+    """
+    Search Console access shared by the websites of one run, set up on first use.
+
+    A run whose sites are all served from the caches never authenticates or
+    lists properties. Each thread gets its own checker (the API client isn't
+    thread-safe); the property list is fetched once and shared.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._properties = None
+        self._listed = False
+
+    def checker(self):
+        """This thread's SearchConsoleChecker, created on first call"""
+        gsc_checker = getattr(self._local, 'checker', None)
+        if gsc_checker is None:
+            gsc_checker = self._local.checker = create_gsc_checker()
+        return gsc_checker
+
+    def properties(self):
+        """Property URLs from list_gsc_properties, fetched on first call"""
+        with self._lock:
+            if not self._listed:
+                self._properties = list_gsc_properties(self.checker())
+                self._listed = True
+            return self._properties
+
+def check_website_indexation(website_config, stop_event=None, gsc_checker=None, gsc_properties=None,
+                              use_cache=True, gsc=None):
     """
     Check indexation for a single website using best available method
 
     Args:
         website_config: Configuration dictionary for the website
         stop_event: Threading event to signal when to stop checking
+        gsc_checker: SearchConsoleChecker to reuse (created if not given)
+        gsc_properties: Property URLs from list_gsc_properties (fetched if not given)
+        use_cache: Reuse results younger than the site's cache_ttl_hours (False re-checks every URL)
+        gsc: LazyGSC shared across a run, used when gsc_checker/gsc_properties aren't given
     """
-    print(f"\n=== Checking: {website_config['name']} ===")
-
-    # Initialize checkers
-    gsc_checker = SearchConsoleChecker('config/google_credentials.json')
-    gsc_available = gsc_checker.service is not None
-
-    # Initialize IndexedAPI checker if configured
-    indexed_api_key = website_config.get('indexed_api_key', None)
-    indexed_api_checker = IndexedAPIChecker(indexed_api_key) if indexed_api_key else None
-    indexed_api_available = indexed_api_checker is not None
-
-    # Get available GSC properties
-    gsc_properties = []
-    if gsc_available:
-        gsc_properties = [prop['url'] for prop in gsc_checker.get_properties()]
-        print(f"[INFO] GSC Properties available: {len(gsc_properties)}")
+    logger.info("=== Checking: %s ===", website_config['name'])
 
     # Fetch URLs from sitemaps
     all_urls = []
 
-    if 'sitemap_url' in website_config:
-        # Single sitemap index
-        print(f"Fetching URLs from sitemap index: {website_config['sitemap_url']}")
-        exclude_sitemaps = website_config.get('exclude_sitemaps', [])
-        all_urls = fetch_urls_from_sitemap_index(website_config['sitemap_url'], exclude_sitemaps)
-
-    elif 'sitemap_urls' in website_config:
-        # Multiple specific sitemaps
-        print(f"Fetching URLs from {len(website_config['sitemap_urls'])} sitemaps")
-        for sitemap_url in website_config['sitemap_urls']:
-            print(f"  Processing: {sitemap_url}")
-            urls = fetch_urls_from_sitemap(sitemap_url)
-            all_urls.extend(urls)
-            time.sleep(1)
+    try:
+        if 'sitemap_url' in website_config:
+            # Single sitemap index
+            logger.info("Fetching URLs from sitemap index: %s", website_config['sitemap_url'])
+            exclude_sitemaps = website_config.get('exclude_sitemaps', [])
+            all_urls = fetch_urls_from_sitemap_index(website_config['sitemap_url'], exclude_sitemaps, stop_event)
+
+        elif 'sitemap_urls' in website_config:
+            # Multiple specific sitemaps
+            logger.info("Fetching URLs from %d sitemaps", len(website_config['sitemap_urls']))
+            for sitemap_url in website_config['sitemap_urls']:
+                logger.info("Processing: %s", sitemap_url)
+                urls = fetch_urls_from_sitemap(sitemap_url, stop_event)
+                all_urls.extend(urls)
+                if pause(1, stop_event):
+                    raise CheckCancelled()
+    except CheckCancelled:
+        logger.info("[STOP] Check stopped by user while fetching sitemaps")
+        return []
 
     if not all_urls:
-        print(f"No URLs found for {website_config['name']}")
+        logger.warning("No URLs found for %s", website_config['name'])
         return []
 
-    # Check for stop signal before processing
-    if stop_event and stop_event.is_set():
-        print("[STOP] Check stopped by user")
-        return []
+    # The same page often appears in several sitemaps - check it once (keeps order)
+    unique_urls = list(dict.fromkeys(all_urls))
+    if len(unique_urls) < len(all_urls):
+        logger.info("Dropped %d duplicate URLs", len(all_urls) - len(unique_urls))
+        all_urls = unique_urls
 
-    print(f"Found {len(all_urls)} URLs to check")
+    logger.info("Found %d URLs to check", len(all_urls))
 
     # Apply URL limit for reasonable processing time
     max_urls = website_config.get('max_urls', 100)  # Default limit of 100 URLs
     if len(all_urls) > max_urls:
-        print(f"[LIMIT] Limiting to first {max_urls} URLs (from {len(all_urls)} total)")
+        logger.info("[LIMIT] Limiting to first %d URLs (from %d total)", max_urls, len(all_urls))
         all_urls = all_urls[:max_urls]
 
+    # Reuse recent results for URLs that were checked within the cache TTL
+    cache_ttl_hours = website_config.get('cache_ttl_hours', DEFAULT_CACHE_TTL_HOURS) if use_cache else 0
+    result_cache = get_result_cache() if cache_ttl_hours else None
+    cached_results = {}
+    if result_cache:
+        cached_results = result_cache.get_fresh(all_urls, cache_ttl_hours * 3600)
+        if cached_results:
+            logger.info("[CACHE] Reusing %d results checked in the last %sh", len(cached_results), cache_ttl_hours)
+
+    urls_to_check = [url for url in all_urls if url not in cached_results]
+    if not urls_to_check:
+        logger.info("[CACHE] All URLs have recent results, skipping checks")
+        return mark_indexed(list(cached_results.values()))
+
+    # Initialize checkers - only now, so a fully cached site makes no API calls
+    if gsc_checker is None:
+        gsc_checker = gsc.checker() if gsc else create_gsc_checker()
+    gsc_available = gsc_checker.service is not None
+
+    # Initialize IndexedAPI checker if configured
+    indexed_api_key = website_config.get('indexed_api_key', None)
+    indexed_api_checker = IndexedAPIChecker(indexed_api_key) if indexed_api_key else None
+    indexed_api_available = indexed_api_checker is not None
+
+    # Get available GSC properties
+    if not gsc_available:
+        gsc_properties = []
+    elif gsc_properties is None:
+        gsc_properties = gsc.properties() if gsc else list_gsc_properties(gsc_checker)
+
     # Determine which method to use (Priority: GSC > IndexedAPI > Google Search)
     website_domain = get_base_domain(all_urls[0]) if all_urls else ""
     gsc_property_url = None
 
     # Check if we have GSC access for this domain
     if gsc_available:
-        for prop_url in gsc_properties:
-            prop_domain = get_base_domain(prop_url)
-            if website_domain in prop_domain or prop_domain in website_domain:
-                gsc_property_url = prop_url
-                break
+        gsc_property_url = find_gsc_property(website_domain, gsc_properties)
 
     # Choose checking method based on availability and configuration
     preferred_method = website_config.get('checking_method', 'auto')  # auto, gsc, indexed_api, google_search
 
     if preferred_method == 'gsc' and gsc_property_url:
-        print(f"[INFO] Using Google Search Console API (preferred) for {website_config['name']}")
-        print(f"[INFO] GSC Property: {gsc_property_url}")
-        results = gsc_checker.check_indexation_status(gsc_property_url, all_urls, stop_event=stop_event)
+        logger.info("Using Google Search Console API (preferred) for %s", website_config['name'])
+        logger.info("GSC Property: %s", gsc_property_url)
+        results = gsc_checker.check_indexation_status(gsc_property_url, urls_to_check, stop_event=stop_event)
 
     elif preferred_method == 'indexed_api' and indexed_api_available:
-        print(f"[INFO] Using IndexedAPI (preferred) for {website_config['name']}")
-        results = indexed_api_checker.check_indexation_status(all_urls, stop_event=stop_event)
+        logger.info("Using IndexedAPI (preferred) for %s", website_config['name'])
+        results = indexed_api_checker.check_indexation_status(urls_to_check, stop_event=stop_event)
 
     elif preferred_method == 'google_search':
-        print(f"[INFO] Using Google Search (preferred) for {website_config['name']}")
-        results = []
-        for i, url in enumerate(all_urls, 1):
-            if stop_event and stop_event.is_set():
-                print(f"[STOP] Check stopped by user after processing {i-1}/{len(all_urls)} URLs")
-                break
-            print(f"Checking {i}/{len(all_urls)}: {url}")
-            status, method = check_indexation_google_search(url)
-            results.append({
-                'url': url,
-                'status': status,
-                'method': method,
-                'check_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
-            if i % 20 == 0:
-                print(f"  Processed {i} URLs, taking a short break...")
-                time.sleep(2)
-            else:
-                time.sleep(0.5)
+        logger.info("Using Google Search (preferred) for %s", website_config['name'])
+        results = check_urls_google_search(urls_to_check, stop_event)
 
     else:
         # Auto mode - use best available method with fallback
@@ -264,89 +742,66 @@ def check_website_indexation(website_config, stop_event=None):
 
         # Try GSC first if available
         if gsc_property_url:
-            print(f"[INFO] Using Google Search Console API (auto) for {website_config['name']}")
-            print(f"[INFO] GSC Property: {gsc_property_url}")
-            results = gsc_checker.check_indexation_status(gsc_property_url, all_urls, stop_event=stop_event)
+            logger.info("Using Google Search Console API (auto) for %s", website_config['name'])
+            logger.info("GSC Property: %s", gsc_property_url)
+            results = gsc_checker.check_indexation_status(gsc_property_url, urls_to_check, stop_event=stop_event)
 
             # Check if GSC actually worked (returned non-empty results)
             if not results:
-                print("[WARN] GSC returned no results, falling back to next method")
+                logger.warning("GSC returned no results, falling back to next method")
 
         # If GSC failed or not available, try IndexedAPI
         if not results and indexed_api_available:
-            print(f"[INFO] Using IndexedAPI (fallback) for {website_config['name']}")
-            print(f"[INFO] Fast and reliable bulk checking")
-            results = indexed_api_checker.check_indexation_status(all_urls, stop_event=stop_event)
+            logger.info("Using IndexedAPI (fallback) for %s", website_config['name'])
+            logger.info("Fast and reliable bulk checking")
+            results = indexed_api_checker.check_indexation_status(urls_to_check, stop_event=stop_event)
 
             # Check if IndexedAPI actually worked
             if not results:
-                print("[WARN] IndexedAPI returned no results, falling back to Google Search")
+                logger.warning("IndexedAPI returned no results, falling back to Google Search")
 
         # If both GSC and IndexedAPI failed, use Google Search fallback
         if not results:
-            print(f"[INFO] Using Google Search fallback for {website_config['name']}")
-            print(f"[WARN] Primary methods failed, using Google Search as last resort")
+            logger.info("Using Google Search fallback for %s", website_config['name'])
+            logger.warning("Primary methods failed, using Google Search as last resort")
 
             # Use Google search fallback
-            results = []
-            for i, url in enumerate(all_urls, 1):
-                # Check for stop signal
-                if stop_event and stop_event.is_set():
-                    print(f"[STOP] Check stopped by user after processing {i-1}/{len(all_urls)} URLs")
-                    break
-
-                print(f"Checking {i}/{len(all_urls)}: {url}")
-
-                status, method = check_indexation_google_search(url)
-
-                results.append({
-                    'url': url,
-                    'status': status,
-                    'method': method,
-                    'check_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-
-                # Adaptive rate limiting for Google search
-                if 'RATE LIMITED' in status:
-                    print(f"  Rate limited! Taking longer break...")
-                    time.sleep(10)  # Longer delay on rate limit
-                elif i % 10 == 0:
-                    print(f"  Processed {i} URLs, taking a break...")
-                    time.sleep(3)  # Longer base delay
-                else:
-                    time.sleep(1.5)  # Increased base delay to avoid rate limits
+            results = check_urls_google_search(urls_to_check, stop_event)
 
-    return results
+    if result_cache:
+        result_cache.store(results)
+
+    return mark_indexed(list(cached_results.values()) + results)
 
 def save_results_to_csv(results, website_name):
-    """Save results to CSV file"""
+    """
+    Save results to CSV file, counting indexed URLs in the same pass
+
+    Returns:
+        (filename, indexed_count, total) - filename is None if nothing was saved
+    """
     if not results:
-        print(f"No results to save for {website_name}")
-        return None
+        logger.warning("No results to save for %s", website_name)
+        return None, 0, 0
 
     # Create filename
     safe_name = website_name.lower().replace(' ', '_').replace('&', 'and')
     filename = f"{safe_name}_indexation_results.csv"
 
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as file:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as file:
             writer = csv.writer(file)
-            writer.writerow(['URL', 'Status', 'Method', 'Check_Date'])
+            writer.writerow(CSV_HEADER)
+            # itemgetter pulls the columns in C - cheaper than DictWriter's per-row dict handling
+            writer.writerows(map(CSV_ROW, results))
 
-            for result in results:
-                writer.writerow([
-                    result['url'],
-                    result['status'],
-                    result['method'],
-                    result['check_date']
-                ])
-
-        print(f"Results saved to: {filename}")
-        return filename
+        indexed_count = sum(result['is_indexed'] for result in results)
+        logger.info("Results saved to: %s", filename)
+        return filename, indexed_count, len(results)
 
     except Exception as e:
-        print(f"Error saving results: {e}")
-        return None
+        logger.error("Error saving results: %s", e)
+        return None, 0, 0
 
 def main():
     """Main function to check all enabled websites"""
@@ -355,8 +810,9 @@ def main():
 
     # Load website configuration
     try:
-        with open('websites_config.json', 'r') as file:
-            config = json.load(file)
+        with open('websites_config.json', 'rb') as file:
+            data = file.read()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
     except FileNotFoundError:
         print("Error: websites_config.json not found")
         return
@@ -364,6 +820,9 @@ def main():
         print("Error: Invalid JSON in websites_config.json")
         return
 
+    # Authenticate and list GSC properties once, when the first site needs them
+    gsc = LazyGSC()
+
     # Check each enabled website
     total_results = []
 
@@ -373,15 +832,15 @@ def main():
             continue
 
         try:
-            results = check_website_indexation(website)
+            results = check_website_indexation(website, gsc=gsc)
             if results:
-                filename = save_results_to_csv(results, website['name'])
+                filename, indexed_count, total = save_results_to_csv(results, website['name'])
                 if filename:
                     total_results.append({
                         'website': website['name'],
                         'filename': filename,
-                        'total_urls': len(results),
-                        'indexed': sum(1 for r in results if 'INDEXED' in r['status']),
+                        'total_urls': total,
+                        'indexed': indexed_count,
                         'method': results[0]['method'] if results else 'Unknown'
                     })
 
@@ -405,4 +864,5 @@ def main():
         print("No results generated")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
\ No newline at end of file
@@ -6,9 +6,24 @@ Third-party API for bulk URL indexation checking
 
 import requests
 import json
+import logging
 import time
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# orjson is an optional speedup for parsing API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def parse_json(payload):
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 class IndexedAPIChecker:
     def __init__(self, api_key=None):
         """Initialize IsIndexed.com API checker"""
@@ -21,6 +36,10 @@ class IndexedAPIChecker:
         if self.api_key:
             self.headers['Authorization'] = f'Bearer {self.api_key}'
 
+        # Keep-alive session so API calls reuse one connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
     def check_api_status(self):
         """Check if API is available"""
         if not self.api_key:
@@ -30,9 +49,10 @@ class IndexedAPIChecker:
         # GSC is working as primary method, so this is fallback only
         try:
             # Test basic connectivity to isindexed.com
-            response = requests.get(
+            # Same pooled session, minus the API-only headers (None drops a session header)
+            response = self.session.get(
                 "https://www.isindexed.com/en/",
-                headers={'User-Agent': 'II-Indexation-Checker/1.0'},
+                headers={'Authorization': None, 'Content-Type': None},
                 timeout=10
             )
 
@@ -56,7 +76,7 @@ class IndexedAPIChecker:
             List of results with status information
         """
         if not self.api_key:
-            print("[ERROR] IsIndexed API: No API key configured")
+            logger.error("IsIndexed API: No API key configured")
             return []
 
         if not urls:
@@ -64,33 +84,33 @@ class IndexedAPIChecker:
 
         # For now, return empty results since API endpoints need to be configured
         # GSC is working as primary method, so this fallback isn't critical
-        print(f"[INFO] IsIndexed API: Service available but API endpoints need configuration")
-        print(f"[INFO] Contact IsIndexed.com for API access details")
-        print(f"[INFO] Using Google Search fallback instead")
+        logger.info("IsIndexed API: Service available but API endpoints need configuration")
+        logger.info("Contact IsIndexed.com for API access details")
+        logger.info("Using Google Search fallback instead")
 
         return []  # Return empty to trigger Google Search fallback
 
     def _check_single_url(self, url):
         """Check a single URL (fallback method)"""
+        check_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         try:
             payload = {'url': url}
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/check-single",
-                headers=self.headers,
                 json=payload,
                 timeout=15
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response.content)
                 indexed = data.get('indexed', False)
 
                 return {
                     'url': url,
                     'status': "INDEXED" if indexed else "NOT INDEXED",
                     'method': "IndexedAPI (single)",
-                    'check_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'check_date': check_date,
                     'details': data.get('details', '')
                 }
             else:
@@ -98,7 +118,7 @@ class IndexedAPIChecker:
                     'url': url,
                     'status': f"ERROR: HTTP {response.status_code}",
                     'method': "IndexedAPI (single)",
-                    'check_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'check_date': check_date,
                     'details': 'API request failed'
                 }
 
@@ -107,7 +127,7 @@ class IndexedAPIChecker:
                 'url': url,
                 'status': f"ERROR: {str(e)}",
                 'method': "IndexedAPI (single)",
-                'check_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'check_date': check_date,
                 'details': 'Request exception'
             }
 
@@ -117,14 +137,13 @@ class IndexedAPIChecker:
             return None
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/credits",
-                headers=self.headers,
                 timeout=10
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response.content)
                 return data.get('credits', 0)
             else:
                 return None
@@ -159,4 +178,5 @@ def test_indexed_api():
             print(f"  {result['url']}: {result['status']}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     test_indexed_api()
\ No newline at end of file
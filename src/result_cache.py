@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Indexation Result Cache
+Remembers recent per-URL results so repeated checks can skip stable URLs,
+and sitemap validators so unchanged sitemaps aren't downloaded again
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# Only definitive answers are cached - errors and rate limits are always retried
+CACHEABLE_STATUSES = {'INDEXED', 'NOT INDEXED', 'NOT IN SEARCH CONSOLE DATA'}
+
+# SQLite's default limit on bound parameters is 999
+QUERY_CHUNK_SIZE = 500
+
+class ResultCache:
+    def __init__(self, db_path='cache/indexation.sqlite'):
+        """Open (or create) the result cache database"""
+        self.db_path = db_path
+        self.lock = threading.Lock()
+
+        cache_dir = os.path.dirname(db_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "url TEXT PRIMARY KEY, status TEXT, method TEXT, checked_at REAL)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS sitemaps ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, locs TEXT, fetched_at REAL)"
+            )
+
+    def get_fresh(self, urls, max_age_seconds):
+        """
+        Look up cached results newer than max_age_seconds
+
+        Returns:
+            Dict of url -> result dict for every URL with a fresh cached result
+        """
+        cutoff = time.time() - max_age_seconds
+        unique_urls = list(dict.fromkeys(urls))
+        fresh = {}
+
+        with self.lock:
+            for start in range(0, len(unique_urls), QUERY_CHUNK_SIZE):
+                chunk = unique_urls[start:start + QUERY_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT url, status, method, checked_at FROM results "
+                    f"WHERE checked_at >= ? AND url IN ({placeholders})",
+                    [cutoff, *chunk]
+                )
+                for url, status, method, checked_at in rows:
+                    fresh[url] = {
+                        'url': url,
+                        'status': status,
+                        'method': method,
+                        'check_date': datetime.fromtimestamp(checked_at).strftime('%Y-%m-%d %H:%M:%S')
+                    }
+
+        return fresh
+
+    def store(self, results):
+        """Save definitive results from a check"""
+        now = time.time()
+        rows = [
+            (r['url'], r['status'], r['method'], now)
+            for r in results if r['status'] in CACHEABLE_STATUSES
+        ]
+        if not rows:
+            return
+
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (url, status, method, checked_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def get_sitemap(self, url):
+        """
+        Look up the last download of a sitemap
+
+        Returns:
+            (etag, last_modified, locs, fetched_at) or None if the sitemap hasn't been seen
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, locs, fetched_at FROM sitemaps WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        etag, last_modified, locs, fetched_at = row
+        return etag, last_modified, locs.split('\n') if locs else [], fetched_at
+
+    def store_sitemap(self, url, etag, last_modified, locs):
+        """Save a sitemap's validators and <loc> entries for conditional re-fetching"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sitemaps (url, etag, last_modified, locs, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, '\n'.join(locs), time.time())
+            )
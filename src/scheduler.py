@@ -7,25 +7,88 @@ Allows automated indexation checking at specified intervals
 import threading
 import time
 import json
+import logging
 import os
+from collections import namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# orjson is an optional speedup for config parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Bounds on how long the scheduler thread sleeps between checks; the cap lets
+# it notice system clock changes
+SCHEDULER_MIN_SLEEP = 1.0
+SCHEDULER_MAX_SLEEP = 3600.0
+
+# Seconds to back off after an unexpected error in the scheduler loop
+SCHEDULER_ERROR_BACKOFF = 300
+
+# Largest valid run_day per interval_type: day of week (1=Monday) or day of
+# month, capped at 28 so every month has it
+RUN_DAY_MAX = {'weekly': 7, 'biweekly': 7, 'monthly': 28}
+
+# Decoded snapshot of the config the schedule checks read, rebuilt whenever the
+# config is loaded or saved
+SchedulerSettings = namedtuple('SchedulerSettings', [
+    'enabled', 'interval_type', 'interval_value', 'run_hour', 'run_minute',
+    'run_day', 'enabled_websites', 'upload_to_sheets', 'last_run_dt'
+])
+
 class IndexationScheduler:
     def __init__(self, config_path='config/scheduler.json'):
         self.config_path = config_path
+        self._ensure_config_dir()
         self.is_running = False
-        self.stop_event = threading.Event()
+        # Stop flag plus the condition the scheduler thread sleeps on
+        self._stop_requested = False
+        self._stop_condition = threading.Condition()
         self.scheduler_thread = None
         self.callback = None
+        self.listeners = []
+        self._last_status = None
+        self._saved_payload = None  # JSON last written to config_path
+        self._next_run_cache = None  # (settings, date, next_run) from get_next_run_time
+        # Per-interval_type handlers, looked up once per check instead of an if/elif chain
+        self._due_checks = {
+            'hours': self._is_due_hours,
+            'daily': self._is_due_daily,
+            'weekly': self._is_due_weekly,
+            'biweekly': self._is_due_biweekly,
+            'monthly': self._is_due_monthly,
+        }
+        self._next_run_calculators = {
+            'hours': self._next_run_hours,
+            'daily': self._next_run_daily,
+            'weekly': self._next_run_weekly,
+            'biweekly': self._next_run_biweekly,
+            'monthly': self._next_run_monthly,
+        }
         self.config = self.load_config()
+        self._refresh_settings()
+
+    def _ensure_config_dir(self):
+        """Create the config directory once up front rather than on every save"""
+        config_dir = os.path.dirname(self.config_path)
+        if not config_dir:
+            return
+        try:
+            os.makedirs(config_dir, exist_ok=True)
+        except OSError as e:
+            logger.error("Error creating scheduler config directory: %s", e)
 
     def load_config(self):
         """Load scheduler configuration"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as file:
-                    return json.load(file)
+                with open(self.config_path, 'rb') as file:
+                    data = file.read()
+                return orjson.loads(data) if orjson is not None else json.loads(data)
             else:
                 # Create default config
                 default_config = {
@@ -43,7 +106,7 @@ class IndexationScheduler:
                 self.save_config(default_config)
                 return default_config
         except Exception as e:
-            print(f"Error loading scheduler config: {e}")
+            logger.error("Error loading scheduler config: %s", e)
             return {}
 
     def save_config(self, config=None):
@@ -51,291 +114,349 @@ class IndexationScheduler:
         try:
             if config is None:
                 config = self.config
-
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-
-            with open(self.config_path, 'w') as file:
-                json.dump(config, file, indent=2)
             self.config = config
+            self._refresh_settings()
+
+            payload = json.dumps(config, indent=2)
+            if payload == self._saved_payload:
+                return
+
+            # Write via a temp file so a crash can't leave a half-written config
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.config_path)
+            self._saved_payload = payload
         except Exception as e:
-            print(f"Error saving scheduler config: {e}")
+            logger.error("Error saving scheduler config: %s", e)
 
     def set_callback(self, callback_func):
         """Set callback function for running checks"""
         self.callback = callback_func
 
+    def add_listener(self, listener):
+        """Register a function called with get_status() whenever the status changes"""
+        self.listeners.append(listener)
+
+    def _notify_listeners(self):
+        """Tell listeners about the current status if it changed since last time"""
+        status = self.get_status()
+        if status == self._last_status:
+            return
+        self._last_status = status
+
+        for listener in self.listeners:
+            try:
+                listener(status)
+            except Exception as e:
+                logger.error("Scheduler listener error: %s", e)
+
+    def _refresh_settings(self):
+        """Rebuild self.settings from self.config, parsing run_time and last_run once"""
+        config = self.config
+
+        try:
+            run_hour, run_minute = map(int, config.get('run_time', '09:00').split(':'))
+        except (AttributeError, ValueError):
+            run_hour, run_minute = 9, 0
+        if not (0 <= run_hour < 24 and 0 <= run_minute < 60):
+            run_hour, run_minute = 9, 0
+
+        # Validated here so the schedule handlers need no error handling; a
+        # non-positive interval would also never advance get_next_run_time
+        interval_value = config.get('interval_value', 24)
+        if not isinstance(interval_value, (int, float)) or interval_value <= 0:
+            interval_value = 24
+
+        # Clamped into range for the interval type - _next_run_monthly would
+        # otherwise raise on days a month doesn't have
+        interval_type = config.get('interval_type', 'hours')
+        try:
+            run_day = int(config.get('run_day', 1))
+        except (TypeError, ValueError):
+            run_day = 1
+        run_day = max(1, min(run_day, RUN_DAY_MAX.get(interval_type, run_day)))
+
+        last_run = config.get('last_run')
+        try:
+            last_run_dt = datetime.fromisoformat(last_run) if last_run else None
+        except (TypeError, ValueError):
+            last_run_dt = None
+
+        self.settings = SchedulerSettings(
+            enabled=config.get('enabled', False),
+            interval_type=interval_type,
+            interval_value=interval_value,
+            run_hour=run_hour,
+            run_minute=run_minute,
+            run_day=run_day,
+            enabled_websites=config.get('enabled_websites', []),
+            upload_to_sheets=config.get('upload_to_sheets', True),
+            last_run_dt=last_run_dt
+        )
+
     def start_scheduler(self):
         """Start the scheduler"""
         if self.is_running:
             return False
 
-        if not self.config.get('enabled', False):
+        if not self.settings.enabled:
             return False
 
         self.is_running = True
-        self.stop_event.clear()
+        with self._stop_condition:
+            self._stop_requested = False
 
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
+        self._notify_listeners()
         return True
 
-    def stop_scheduler(self):
-        """Stop the scheduler"""
+    def stop_scheduler(self, timeout=5):
+        """Stop the scheduler, waiting up to `timeout` seconds for its thread to exit"""
         self.is_running = False
-        self.stop_event.set()
+        with self._stop_condition:
+            self._stop_requested = True
+            self._stop_condition.notify_all()
         if self.scheduler_thread and self.scheduler_thread.is_alive():
-            self.scheduler_thread.join(timeout=5)
+            self.scheduler_thread.join(timeout=timeout)
+        self._notify_listeners()
 
     def _scheduler_loop(self):
-        """Main scheduler loop"""
-        while not self.stop_event.is_set():
+        """Main scheduler loop - sleeps until the next possible run instead of polling"""
+        while True:
             try:
                 if self._should_run_check():
                     self._run_scheduled_check()
 
-                # Check every minute
-                self.stop_event.wait(60)
+                if self._wait_for_stop(self._seconds_until_next_check()):
+                    return
 
             except Exception as e:
-                print(f"Scheduler error: {e}")
-                self.stop_event.wait(300)  # Wait 5 minutes on error
+                logger.error("Scheduler error: %s", e)
+                if self._wait_for_stop(SCHEDULER_ERROR_BACKOFF):
+                    return
 
-    def _should_run_check(self):
-        """Check if we should run the indexation check"""
-        if not self.config.get('enabled', False):
-            return False
+    def _wait_for_stop(self, seconds):
+        """
+        Block until stop_scheduler is called or `seconds` have passed
 
-        interval_type = self.config.get('interval_type', 'hours')
-        interval_value = self.config.get('interval_value', 24)
-        run_time = self.config.get('run_time', '09:00')
-        run_day = self.config.get('run_day', 1)
-        last_run = self.config.get('last_run')
+        wait_for tracks a monotonic deadline, so an early wakeup resumes with the
+        remaining time rather than cutting the sleep short.
 
+        Returns:
+            True if the scheduler was asked to stop
+        """
+        with self._stop_condition:
+            return self._stop_condition.wait_for(lambda: self._stop_requested, timeout=seconds)
+
+    def _seconds_until_next_check(self):
+        """Seconds to sleep before _should_run_check could next return True"""
         now = datetime.now()
+        next_run = self.get_next_run_time(now)
 
-        # Parse run time
-        try:
-            run_hour, run_minute = map(int, run_time.split(':'))
-        except:
-            run_hour, run_minute = 9, 0
+        # _should_run_check only fires at run_time, so never sleep past its next
+        # occurrence even if get_next_run_time points further out
+        settings = self.settings
+        next_time_of_day = now.replace(hour=settings.run_hour, minute=settings.run_minute,
+                                       second=0, microsecond=0)
+        if next_time_of_day <= now:
+            next_time_of_day += timedelta(days=1)
+
+        if next_run is None or next_run > next_time_of_day:
+            next_run = next_time_of_day
 
-        # Check if we're at the right time of day
-        current_time = now.time()
-        target_time = datetime.now().replace(hour=run_hour, minute=run_minute, second=0, microsecond=0).time()
+        wait_secs = (next_run - now).total_seconds()
+        return max(SCHEDULER_MIN_SLEEP, min(SCHEDULER_MAX_SLEEP, wait_secs))
 
-        # Allow 1-minute window
-        time_match = abs((datetime.combine(datetime.today(), current_time) -
-                         datetime.combine(datetime.today(), target_time)).seconds) < 60
+    def _should_run_check(self):
+        """Check if we should run the indexation check"""
+        settings = self.settings
+        if not settings.enabled:
+            return False
+
+        now = datetime.now()
 
-        if not time_match:
+        # Check if we're at the right time of day (1-minute window)
+        if now.hour != settings.run_hour or now.minute != settings.run_minute:
             return False
 
         # Check scheduling conditions based on interval type
-        if interval_type == 'hours':
-            # Legacy hourly scheduling
-            if last_run:
-                try:
-                    last_run_dt = datetime.fromisoformat(last_run)
-                    time_since_last = now - last_run_dt
-
-                    if time_since_last.total_seconds() < (interval_value * 3600 - 300):  # 5-minute buffer
-                        return False
-                except:
-                    pass
-            return True
-
-        elif interval_type == 'daily':
-            # Daily scheduling - run every day at specified time
-            if last_run:
-                try:
-                    last_run_dt = datetime.fromisoformat(last_run)
-                    # Don't run if we already ran today
-                    if last_run_dt.date() == now.date():
-                        return False
-                except:
-                    pass
-            return True
-
-        elif interval_type == 'weekly':
-            # Weekly scheduling - run on specific day of week
-            if now.weekday() + 1 != run_day:  # weekday() returns 0-6, we use 1-7
+        is_due = self._due_checks.get(settings.interval_type)
+        return is_due(now, settings) if is_due else False
+
+    def _is_due_hours(self, now, settings):
+        """Legacy hourly scheduling"""
+        if settings.last_run_dt:
+            time_since_last = now - settings.last_run_dt
+            if time_since_last.total_seconds() < (settings.interval_value * 3600 - 300):  # 5-minute buffer
                 return False
+        return True
+
+    def _is_due_daily(self, now, settings):
+        """Daily scheduling - run every day at specified time"""
+        # Don't run if we already ran today
+        last_run_dt = settings.last_run_dt
+        return not (last_run_dt and last_run_dt.date() == now.date())
+
+    def _is_due_weekly(self, now, settings):
+        """Weekly scheduling - run on specific day of week"""
+        if now.weekday() + 1 != settings.run_day:  # weekday() returns 0-6, we use 1-7
+            return False
 
-            if last_run:
-                try:
-                    last_run_dt = datetime.fromisoformat(last_run)
-                    # Don't run if we already ran this week
-                    days_since_last = (now.date() - last_run_dt.date()).days
-                    if days_since_last < 6:  # Less than 6 days since last run
-                        return False
-                except:
-                    pass
-            return True
-
-        elif interval_type == 'biweekly':
-            # Bi-weekly scheduling - run every 2 weeks on specific day
-            if now.weekday() + 1 != run_day:
+        if settings.last_run_dt:
+            # Don't run if we already ran this week
+            days_since_last = (now.date() - settings.last_run_dt.date()).days
+            if days_since_last < 6:  # Less than 6 days since last run
                 return False
+        return True
+
+    def _is_due_biweekly(self, now, settings):
+        """Bi-weekly scheduling - run every 2 weeks on specific day"""
+        if now.weekday() + 1 != settings.run_day:
+            return False
 
-            if last_run:
-                try:
-                    last_run_dt = datetime.fromisoformat(last_run)
-                    # Don't run if we already ran in the last 13 days
-                    days_since_last = (now.date() - last_run_dt.date()).days
-                    if days_since_last < 13:  # Less than 13 days since last run
-                        return False
-                except:
-                    pass
-            return True
-
-        elif interval_type == 'monthly':
-            # Monthly scheduling - run on specific day of month
-            if now.day != run_day:
+        if settings.last_run_dt:
+            # Don't run if we already ran in the last 13 days
+            days_since_last = (now.date() - settings.last_run_dt.date()).days
+            if days_since_last < 13:  # Less than 13 days since last run
                 return False
+        return True
 
-            if last_run:
-                try:
-                    last_run_dt = datetime.fromisoformat(last_run)
-                    # Don't run if we already ran this month
-                    if (last_run_dt.year == now.year and
-                        last_run_dt.month == now.month):
-                        return False
-                except:
-                    pass
-            return True
+    def _is_due_monthly(self, now, settings):
+        """Monthly scheduling - run on specific day of month"""
+        if now.day != settings.run_day:
+            return False
 
-        return False
+        # Don't run if we already ran this month
+        last_run_dt = settings.last_run_dt
+        return not (last_run_dt and last_run_dt.year == now.year and
+                    last_run_dt.month == now.month)
 
     def _run_scheduled_check(self):
         """Run the scheduled indexation check"""
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Running scheduled indexation check...")
+            logger.info("Running scheduled indexation check...")
 
             if self.callback:
                 # Run the callback (which should be the main app's check function)
-                websites = self.config.get('enabled_websites', [])
-                upload_sheets = self.config.get('upload_to_sheets', True)
-
-                self.callback(websites, upload_sheets)
+                self.callback(self.settings.enabled_websites, self.settings.upload_to_sheets)
 
             # Update last run time
             self.config['last_run'] = datetime.now().isoformat()
             self.save_config()
+            self._notify_listeners()
 
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Scheduled check completed")
+            logger.info("Scheduled check completed, next run at %s", self.get_next_run_time())
 
         except Exception as e:
-            print(f"Error in scheduled check: {e}")
+            logger.error("Error in scheduled check: %s", e)
 
-    def get_next_run_time(self):
-        """Get the next scheduled run time"""
-        if not self.config.get('enabled', False):
+    def get_next_run_time(self, now=None):
+        """Get the next scheduled run time, optionally relative to a caller's `now`"""
+        settings = self.settings
+        if not settings.enabled:
             return None
 
-        interval_type = self.config.get('interval_type', 'hours')
-        interval_value = self.config.get('interval_value', 24)
-        run_time = self.config.get('run_time', '09:00')
-        run_day = self.config.get('run_day', 1)
-        last_run = self.config.get('last_run')
-
-        try:
-            run_hour, run_minute = map(int, run_time.split(':'))
-        except:
-            run_hour, run_minute = 9, 0
-
-        now = datetime.now()
-
-        if interval_type == 'hours':
-            # Legacy hourly scheduling
-            if last_run:
-                try:
-                    last_run_dt = datetime.fromisoformat(last_run)
-                    next_run = last_run_dt + timedelta(hours=interval_value)
-                    next_run = next_run.replace(hour=run_hour, minute=run_minute, second=0, microsecond=0)
-
-                    while next_run <= now:
-                        next_run += timedelta(hours=interval_value)
-
-                    return next_run
-                except:
-                    pass
+        next_run_for = self._next_run_calculators.get(settings.interval_type)
+        if next_run_for is None:
+            return None
 
-            # Calculate next run from current time
-            next_run = now.replace(hour=run_hour, minute=run_minute, second=0, microsecond=0)
-            if next_run <= now:
+        if now is None:
+            now = datetime.now()
+
+        # The answer only changes with the settings, the date (biweekly looks at
+        # days since the last run) or once the computed run time has passed
+        cached = self._next_run_cache
+        if cached and cached[0] is settings and cached[1] == now.date() and now < cached[2]:
+            return cached[2]
+
+        # Today at run_time - the starting point for every interval type
+        at_run_time = now.replace(hour=settings.run_hour, minute=settings.run_minute,
+                                  second=0, microsecond=0)
+        next_run = next_run_for(now, at_run_time, settings)
+        self._next_run_cache = (settings, now.date(), next_run)
+        return next_run
+
+    def _next_run_hours(self, now, at_run_time, settings):
+        """Legacy hourly scheduling"""
+        interval_value = settings.interval_value
+        if settings.last_run_dt:
+            next_run = settings.last_run_dt + timedelta(hours=interval_value)
+            next_run = next_run.replace(hour=at_run_time.hour, minute=at_run_time.minute,
+                                        second=0, microsecond=0)
+
+            while next_run <= now:
                 next_run += timedelta(hours=interval_value)
-            return next_run
 
-        elif interval_type == 'daily':
-            # Daily scheduling
-            next_run = now.replace(hour=run_hour, minute=run_minute, second=0, microsecond=0)
-            if next_run <= now:
-                next_run += timedelta(days=1)
             return next_run
 
-        elif interval_type == 'weekly':
-            # Weekly scheduling - find next occurrence of run_day
-            days_ahead = run_day - (now.weekday() + 1)
-            if days_ahead <= 0:  # Target day already happened this week
-                days_ahead += 7
-
-            next_run = now + timedelta(days=days_ahead)
-            next_run = next_run.replace(hour=run_hour, minute=run_minute, second=0, microsecond=0)
-            return next_run
-
-        elif interval_type == 'biweekly':
-            # Bi-weekly scheduling
-            days_ahead = run_day - (now.weekday() + 1)
-            if days_ahead <= 0:  # Target day already happened this week
-                days_ahead += 14  # Next occurrence in 2 weeks
+        # Calculate next run from current time
+        next_run = at_run_time
+        if next_run <= now:
+            next_run += timedelta(hours=interval_value)
+        return next_run
+
+    def _next_run_daily(self, now, at_run_time, settings):
+        """Daily scheduling"""
+        if at_run_time <= now:
+            return at_run_time + timedelta(days=1)
+        return at_run_time
+
+    def _next_run_weekly(self, now, at_run_time, settings):
+        """Weekly scheduling - find next occurrence of run_day"""
+        days_ahead = settings.run_day - (now.weekday() + 1)
+        if days_ahead <= 0:  # Target day already happened this week
+            days_ahead += 7
+
+        return at_run_time + timedelta(days=days_ahead)
+
+    def _next_run_biweekly(self, now, at_run_time, settings):
+        """Bi-weekly scheduling"""
+        days_ahead = settings.run_day - (now.weekday() + 1)
+        if days_ahead <= 0:  # Target day already happened this week
+            days_ahead += 14  # Next occurrence in 2 weeks
+        else:
+            # Check if we need to skip to next cycle
+            if settings.last_run_dt:
+                days_since_last = (now.date() - settings.last_run_dt.date()).days
+                if days_since_last < 13:  # Last run was less than 2 weeks ago
+                    days_ahead += 7  # Skip to next week's occurrence
+
+        return at_run_time + timedelta(days=days_ahead)
+
+    def _next_run_monthly(self, now, at_run_time, settings):
+        """Monthly scheduling - find next occurrence of run_day in month"""
+        next_run = at_run_time.replace(day=settings.run_day)
+
+        # If the target day has passed this month, go to next month
+        if next_run <= now:
+            if now.month == 12:
+                next_run = next_run.replace(year=now.year + 1, month=1)
             else:
-                # Check if we need to skip to next cycle
-                if last_run:
-                    try:
-                        last_run_dt = datetime.fromisoformat(last_run)
-                        days_since_last = (now.date() - last_run_dt.date()).days
-                        if days_since_last < 13:  # Last run was less than 2 weeks ago
-                            days_ahead += 7  # Skip to next week's occurrence
-
-                    except:
-                        pass
-
-            next_run = now + timedelta(days=days_ahead)
-            next_run = next_run.replace(hour=run_hour, minute=run_minute, second=0, microsecond=0)
-            return next_run
-
-        elif interval_type == 'monthly':
-            # Monthly scheduling - find next occurrence of run_day in month
-            next_run = now.replace(day=run_day, hour=run_hour, minute=run_minute, second=0, microsecond=0)
+                next_run = next_run.replace(month=now.month + 1)
 
-            # If the target day has passed this month, go to next month
-            if next_run <= now:
-                if now.month == 12:
-                    next_run = next_run.replace(year=now.year + 1, month=1)
-                else:
-                    next_run = next_run.replace(month=now.month + 1)
-
-            return next_run
-
-        return None
+        return next_run
 
     def get_status(self):
         """Get scheduler status"""
+        settings = self.settings
         next_run = self.get_next_run_time()
 
         return {
-            'enabled': self.config.get('enabled', False),
+            'enabled': settings.enabled,
             'running': self.is_running,
-            'interval_type': self.config.get('interval_type', 'hours'),
-            'interval_value': self.config.get('interval_value', 24),
+            'interval_type': settings.interval_type,
+            'interval_value': settings.interval_value,
             'interval_hours': self.config.get('interval_hours', 24),  # Legacy support
             'run_time': self.config.get('run_time', '09:00'),
-            'run_day': self.config.get('run_day', 1),
+            'run_day': settings.run_day,
             'last_run': self.config.get('last_run'),
             'next_run': next_run.isoformat() if next_run else None,
-            'enabled_websites': self.config.get('enabled_websites', []),
-            'upload_to_sheets': self.config.get('upload_to_sheets', True)
+            'enabled_websites': settings.enabled_websites,
+            'upload_to_sheets': settings.upload_to_sheets
         }
 
     def update_config(self, **kwargs):
@@ -354,5 +475,7 @@ class IndexationScheduler:
         # Restart scheduler if it was running
         if self.is_running:
             self.stop_scheduler()
-            if self.config.get('enabled', False):
-                self.start_scheduler()
\ No newline at end of file
+            if self.settings.enabled:
+                self.start_scheduler()
+
+        self._notify_listeners()
@@ -6,61 +6,97 @@ Uses GSC API to check indexation status accurately
 
 import json
 import csv
+import functools
+import logging
 from datetime import datetime, timedelta
 from googleapiclient.discovery import build
 from google.oauth2.service_account import Credentials
 import os
 
+logger = logging.getLogger(__name__)
+
+# Maximum rows the Search Analytics API returns per query
+SEARCH_ANALYTICS_ROW_LIMIT = 25000
+
+# Write buffer for result CSVs, so large result sets go out in few write calls
+CSV_WRITE_BUFFER = 1 << 20
+
+# Read-only scope for the Search Console API
+SEARCH_CONSOLE_SCOPES = ('https://www.googleapis.com/auth/webmasters.readonly',)
+
+@functools.lru_cache(maxsize=4)
+def _load_credentials(credentials_file, modified_time):
+    """
+    Load service account credentials and the project ID they belong to
+
+    Cached per credentials file and its modification time, so repeated checkers
+    (e.g. one per scheduled run) skip the file read and key parsing, while a
+    replaced credentials file is picked up. Only the credentials are shared -
+    each checker still builds its own client, as those aren't thread-safe.
+
+    Returns:
+        (credentials, project_id)
+    """
+    credentials = Credentials.from_service_account_file(
+        credentials_file, scopes=list(SEARCH_CONSOLE_SCOPES)
+    )
+
+    # Load the credentials file to get project ID
+    with open(credentials_file, 'r') as f:
+        creds_data = json.load(f)
+    project_id = creds_data.get('project_id')
+
+    logger.info("Using project ID: %s", project_id)
+    return credentials, project_id
+
 class SearchConsoleChecker:
     def __init__(self, credentials_file=None):
         """Initialize Search Console API client"""
         self.credentials_file = credentials_file or 'search_console_credentials.json'
         self.service = None
+        # searchanalytics() resource, built once per client
+        self._search_analytics = None
+        # Property list from the last successful sites.list call
+        self._properties = None
         self.setup_client()
 
     def setup_client(self):
         """Setup Google Search Console API client"""
         try:
             if not os.path.exists(self.credentials_file):
-                print(f"[ERROR] Credentials file {self.credentials_file} not found.")
-                print("Please make sure you downloaded the JSON file from Google Cloud")
+                logger.error("Credentials file %s not found.", self.credentials_file)
+                logger.error("Please make sure you downloaded the JSON file from Google Cloud")
                 return False
 
-            # Define the scope
-            scopes = ['https://www.googleapis.com/auth/webmasters.readonly']
-
-            # Load credentials and explicitly set project
-            credentials = Credentials.from_service_account_file(
-                self.credentials_file, scopes=scopes
+            credentials, project_id = _load_credentials(
+                self.credentials_file, os.path.getmtime(self.credentials_file)
             )
 
-            # Load the credentials file to get project ID
-            with open(self.credentials_file, 'r') as f:
-                creds_data = json.load(f)
-            project_id = creds_data.get('project_id')
-
-            print(f"[INFO] Using project ID: {project_id}")
-
             # Build the service with explicit project
             self.service = build('searchconsole', 'v1',
                                credentials=credentials,
                                cache_discovery=False)  # Disable caching
 
+            self._search_analytics = self.service.searchanalytics()
+
             # Store project ID for reference
             self.project_id = project_id
-            print("[OK] Search Console API client initialized successfully")
+            logger.info("Search Console API client initialized successfully")
             return True
 
         except Exception as e:
-            print(f"[ERROR] Error setting up Search Console client: {e}")
+            logger.error("Error setting up Search Console client: %s", e)
             return False
 
-    def get_properties(self):
-        """Get list of properties (websites) available"""
+    def get_properties(self, refresh=False):
+        """Get list of properties (websites) available, cached after the first successful call"""
         if not self.service:
-            print("[ERROR] Search Console client not initialized")
+            logger.error("Search Console client not initialized")
             return []
 
+        if self._properties is not None and not refresh:
+            return self._properties
+
         try:
             request = self.service.sites().list()
             response = request.execute()
@@ -73,10 +109,11 @@ class SearchConsoleChecker:
                         'permission': site['permissionLevel']
                     })
 
+            self._properties = properties
             return properties
 
         except Exception as e:
-            print(f"[ERROR] Error getting properties: {e}")
+            logger.error("Error getting properties: %s", e)
             return []
 
     def check_indexation_status(self, site_url, urls_to_check, days_back=90, stop_event=None):
@@ -90,7 +127,7 @@ class SearchConsoleChecker:
             stop_event: Threading event to signal when to stop checking
         """
         if not self.service:
-            print("[ERROR] Search Console client not initialized")
+            logger.error("Search Console client not initialized")
             return []
 
         try:
@@ -100,87 +137,103 @@ class SearchConsoleChecker:
 
             results = []
 
-            print(f"[INFO] Checking {len(urls_to_check)} URLs against Search Console data...")
-            print(f"[INFO] Date range: {start_date} to {end_date}")
-
-            # Get Search Console data for the site
-            request = self.service.searchanalytics().query(
-                siteUrl=site_url,
-                body={
-                    'startDate': start_date.strftime('%Y-%m-%d'),
-                    'endDate': end_date.strftime('%Y-%m-%d'),
-                    'dimensions': ['page'],
-                    'rowLimit': 25000  # Maximum allowed
-                }
-            )
-
-            response = request.execute()
+            logger.info("Checking %d URLs against Search Console data...", len(urls_to_check))
+            logger.info("Date range: %s to %s", start_date, end_date)
 
-            # Extract indexed pages from Search Console
+            # Get Search Console data for the site - one query covers every URL,
+            # paging through startRow only when the site has more pages than fit
             indexed_pages = set()
-            if 'rows' in response:
-                for row in response['rows']:
-                    indexed_pages.add(row['keys'][0])
+            body = {
+                'startDate': start_date.strftime('%Y-%m-%d'),
+                'endDate': end_date.strftime('%Y-%m-%d'),
+                'dimensions': ['page'],
+                'rowLimit': SEARCH_ANALYTICS_ROW_LIMIT,
+                'startRow': 0
+            }
+            while True:
+                request = self._search_analytics.query(siteUrl=site_url, body=body)
+
+                # Extract indexed pages from Search Console, dropping each page's
+                # response as soon as its URLs are in the set
+                rows = request.execute().get('rows', ())
+                indexed_pages.update(row['keys'][0] for row in rows)
+
+                if len(rows) < SEARCH_ANALYTICS_ROW_LIMIT:
+                    break
+                if stop_event and stop_event.is_set():
+                    logger.info("[STOP] GSC check stopped by user")
+                    return results
+                body['startRow'] += SEARCH_ANALYTICS_ROW_LIMIT
+                logger.debug("Fetching Search Console rows from %d", body['startRow'])
+
+            pages_fetched = body['startRow'] // SEARCH_ANALYTICS_ROW_LIMIT + 1
+            if pages_fetched > 1:
+                logger.info("Fetched Search Console data in %d pages of %d rows",
+                            pages_fetched, SEARCH_ANALYTICS_ROW_LIMIT)
+            logger.info("Found %d pages with Search Console data", len(indexed_pages))
+
+            # Every URL in this run shares one check timestamp
+            check_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-            print(f"[INFO] Found {len(indexed_pages)} pages with Search Console data")
+            # Pages with any trailing slash removed, so the with/without-slash
+            # fallback is a single lookup per URL
+            indexed_canon = {page.rstrip('/') for page in indexed_pages}
+
+            # Strip and dedupe once, keeping sitemap order for the results
+            clean_urls = list(dict.fromkeys(url.strip() for url in urls_to_check))
+
+            # Exact matches come from one set intersection; only the misses need
+            # the trailing-slash fallback
+            exact_hits = indexed_pages.intersection(clean_urls)
 
             # Check each URL
-            for url in urls_to_check:
+            for clean_url in clean_urls:
                 # Check for stop signal
                 if stop_event and stop_event.is_set():
-                    print("[STOP] GSC check stopped by user")
+                    logger.info("[STOP] GSC check stopped by user")
                     break
 
-                # Clean URL for comparison
-                clean_url = url.strip()
-
                 # Check if URL appears in Search Console data
-                if clean_url in indexed_pages:
+                if clean_url in exact_hits:
                     status = "INDEXED"
                     method = "Search Console Data"
+                elif clean_url.rstrip('/') in indexed_canon:
+                    # Matched with the trailing slash added or removed
+                    status = "INDEXED"
+                    method = "Search Console Data (alt URL)"
                 else:
-                    # Try with and without trailing slash
-                    alt_url = clean_url.rstrip('/') if clean_url.endswith('/') else clean_url + '/'
-                    if alt_url in indexed_pages:
-                        status = "INDEXED"
-                        method = "Search Console Data (alt URL)"
-                    else:
-                        status = "NOT IN SEARCH CONSOLE DATA"
-                        method = "Search Console Data"
+                    status = "NOT IN SEARCH CONSOLE DATA"
+                    method = "Search Console Data"
 
                 results.append({
                     'url': clean_url,
                     'status': status,
                     'method': method,
-                    'check_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'check_date': check_date
                 })
 
             return results
 
         except Exception as e:
-            print(f"[ERROR] Error checking indexation: {e}")
+            logger.error("Error checking indexation: %s", e)
             return []
 
     def save_results_to_csv(self, results, filename):
         """Save results to CSV file"""
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as file:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as file:
                 writer = csv.writer(file)
                 writer.writerow(['URL', 'Status', 'Method', 'Check_Date'])
+                writer.writerows(
+                    (result['url'], result['status'], result['method'], result['check_date'])
+                    for result in results
+                )
 
-                for result in results:
-                    writer.writerow([
-                        result['url'],
-                        result['status'],
-                        result['method'],
-                        result['check_date']
-                    ])
-
-            print(f"[OK] Results saved to {filename}")
+            logger.info("Results saved to %s", filename)
             return True
 
         except Exception as e:
-            print(f"[ERROR] Error saving results: {e}")
+            logger.error("Error saving results: %s", e)
             return False
 
 def main():
@@ -235,4 +288,5 @@ def main():
             print(f"Results saved to: {filename}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
\ No newline at end of file
@@ -5,6 +5,7 @@ Test Austin Fence & Deck Builders indexation checking
 
 import sys
 import json
+import logging
 from pathlib import Path
 
 # Add src directory to path
@@ -74,4 +75,5 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
\ No newline at end of file
@@ -6,50 +6,48 @@ Tests all core features without requiring GUI interaction
 
 import sys
 import os
+import argparse
 import json
+import importlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-def test_imports():
-    """Test that all required modules can be imported"""
-    print("[TEST] Testing imports...")
+from test_utils import pause_before_exit
 
-    try:
-        from indexation_checker import check_website_indexation, save_results_to_csv
-        print("[PASS] indexation_checker module imported successfully")
-    except ImportError as e:
-        print(f"[FAIL] Failed to import indexation_checker: {e}")
-        return False
+# App modules are imported on first use and reused by later tests, so a run
+# limited to e.g. file_structure never loads the Google client libraries
+APP_MODULES = ('indexation_checker', 'search_console_checker', 'indexed_api_checker',
+               'google_sheets_integration', 'scheduler')
+_modules = {}
+_import_errors = {}
 
-    try:
-        from search_console_checker import SearchConsoleChecker
-        print("[PASS] search_console_checker module imported successfully")
-    except ImportError as e:
-        print(f"[FAIL] Failed to import search_console_checker: {e}")
-        return False
-
-    try:
-        from indexed_api_checker import IndexedAPIChecker
-        print("[PASS] indexed_api_checker module imported successfully")
-    except ImportError as e:
-        print(f"[FAIL] Failed to import indexed_api_checker: {e}")
-        return False
+def app_module(name):
+    """Import an app module once, re-raising its ImportError on every call if it failed"""
+    if name not in _modules and name not in _import_errors:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError as e:
+            _import_errors[name] = e
+    if name in _import_errors:
+        raise _import_errors[name]
+    return _modules[name]
 
-    try:
-        from google_sheets_integration import GoogleSheetsIntegration
-        print("[PASS] google_sheets_integration module imported successfully")
-    except ImportError as e:
-        print(f"[FAIL] Failed to import google_sheets_integration: {e}")
-        return False
+def test_imports():
+    """Test that all required modules can be imported"""
+    print("[TEST] Testing imports...")
 
-    try:
-        from scheduler import IndexationScheduler
-        print("[PASS] scheduler module imported successfully")
-    except ImportError as e:
-        print(f"[FAIL] Failed to import scheduler: {e}")
-        return False
+    for name in APP_MODULES:
+        try:
+            app_module(name)
+        except ImportError as e:
+            print(f"[FAIL] Failed to import {name}: {e}")
+            return False
+        print(f"[PASS] {name} module imported successfully")
 
     return True
 
@@ -59,10 +57,6 @@ def test_configuration_loading():
 
     config_path = "config/websites.json"
 
-    if not os.path.exists(config_path):
-        print(f"❌ Configuration file not found: {config_path}")
-        return False
-
     try:
         with open(config_path, 'r') as file:
             config = json.load(file)
@@ -87,6 +81,9 @@ def test_configuration_loading():
         print("✅ All websites have valid configuration")
         return True
 
+    except FileNotFoundError:
+        print(f"❌ Configuration file not found: {config_path}")
+        return False
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON in configuration file: {e}")
         return False
@@ -100,24 +97,25 @@ def test_google_credentials():
 
     creds_path = "config/google_credentials.json"
 
-    if not os.path.exists(creds_path):
-        print(f"❌ Google credentials file not found: {creds_path}")
-        return False
-
     try:
         with open(creds_path, 'r') as file:
             creds = json.load(file)
 
         required_fields = ['type', 'project_id', 'private_key', 'client_email']
 
-        for field in required_fields:
-            if field not in creds:
+        # One pass over the required keys, reporting every missing one
+        missing_fields = [field for field in required_fields if field not in creds]
+        if missing_fields:
+            for field in missing_fields:
                 print(f"❌ Google credentials missing '{field}' field")
-                return False
+            return False
 
         print("✅ Google credentials file is valid")
         return True
 
+    except FileNotFoundError:
+        print(f"❌ Google credentials file not found: {creds_path}")
+        return False
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON in credentials file: {e}")
         return False
@@ -130,9 +128,7 @@ def test_search_console_initialization():
     print("\n🔧 Testing Google Search Console initialization...")
 
     try:
-        from search_console_checker import SearchConsoleChecker
-
-        gsc_checker = SearchConsoleChecker('config/google_credentials.json')
+        gsc_checker = app_module('search_console_checker').SearchConsoleChecker('config/google_credentials.json')
 
         if gsc_checker.service is not None:
             print("✅ Google Search Console API initialized successfully")
@@ -150,10 +146,8 @@ def test_indexed_api_initialization():
     print("\n🌐 Testing IndexedAPI initialization...")
 
     try:
-        from indexed_api_checker import IndexedAPIChecker
-
         # Test without API key (should work but won't be functional)
-        api_checker = IndexedAPIChecker()
+        api_checker = app_module('indexed_api_checker').IndexedAPIChecker()
         print("✅ IndexedAPI checker initialized successfully")
 
         # Test API status check
@@ -183,7 +177,7 @@ def test_website_processing():
         print("✅ Test website configuration created")
 
         # Test that we can determine the checking method
-        from indexation_checker import check_website_indexation
+        app_module('indexation_checker').check_website_indexation
 
         print("✅ Website processing logic accessible")
         return True
@@ -210,11 +204,7 @@ def test_file_structure():
         "config/google_credentials.json"
     ]
 
-    missing_files = []
-
-    for file_path in required_files:
-        if not os.path.exists(file_path):
-            missing_files.append(file_path)
+    missing_files = [file_path for file_path in required_files if not os.path.exists(file_path)]
 
     if missing_files:
         print("❌ Missing required files:")
@@ -225,30 +215,86 @@ def test_file_structure():
         print("✅ All required files present")
         return True
 
-def run_all_tests():
-    """Run all tests and provide summary"""
+class ThreadBufferedStdout:
+    """stdout stand-in that buffers writes from threads running under capture()"""
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+
+    def write(self, text):
+        buffer = self.buffers.get(threading.get_ident())
+        if buffer is None:
+            return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, func, *args):
+        """Call func, returning (its result, everything it printed)"""
+        thread_id = threading.get_ident()
+        self.buffers[thread_id] = []
+        try:
+            return func(*args), ''.join(self.buffers[thread_id])
+        finally:
+            del self.buffers[thread_id]
+
+def run_test(test_name, test_func):
+    """Run one test, treating an unexpected exception as a failure"""
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"❌ {test_name} failed with exception: {e}")
+        return False
+
+def selection_key(test_func):
+    """Name used to select a test with --only, e.g. test_file_structure -> file_structure"""
+    return test_func.__name__[len('test_'):]
+
+# Filesystem and import tests run first, in order; the rest wait on network
+# or OAuth I/O, so they run side by side
+SERIAL_TESTS = [
+    ("File Structure", test_file_structure),
+    ("Module Imports", test_imports),
+    ("Configuration Loading", test_configuration_loading),
+    ("Google Credentials", test_google_credentials)
+]
+PARALLEL_TESTS = [
+    ("Search Console Init", test_search_console_initialization),
+    ("IndexedAPI Init", test_indexed_api_initialization),
+    ("Website Processing", test_website_processing)
+]
+
+def run_all_tests(only=None):
+    """Run all tests (or just those whose keys are in `only`) and provide summary"""
     print("II Indexation Checker - Functionality Testing")
     print("=" * 50)
 
-    tests = [
-        ("File Structure", test_file_structure),
-        ("Module Imports", test_imports),
-        ("Configuration Loading", test_configuration_loading),
-        ("Google Credentials", test_google_credentials),
-        ("Search Console Init", test_search_console_initialization),
-        ("IndexedAPI Init", test_indexed_api_initialization),
-        ("Website Processing", test_website_processing)
-    ]
+    serial_tests = SERIAL_TESTS
+    parallel_tests = PARALLEL_TESTS
+    if only:
+        serial_tests = [test for test in serial_tests if selection_key(test[1]) in only]
+        parallel_tests = [test for test in parallel_tests if selection_key(test[1]) in only]
 
-    results = []
+    results = [(test_name, run_test(test_name, test_func)) for test_name, test_func in serial_tests]
 
-    for test_name, test_func in tests:
+    # Each parallel test's output is held back and printed in list order
+    outcomes = []
+    if parallel_tests:
+        stdout = ThreadBufferedStdout(sys.stdout)
+        sys.stdout = stdout
         try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+            with ThreadPoolExecutor(max_workers=len(parallel_tests)) as executor:
+                outcomes = list(executor.map(
+                    lambda test: stdout.capture(run_test, *test), parallel_tests
+                ))
+        finally:
+            sys.stdout = stdout.stream
+
+    for (test_name, _), (result, output) in zip(parallel_tests, outcomes):
+        print(output, end='')
+        results.append((test_name, result))
 
     # Summary
     print("\n" + "=" * 50)
@@ -273,8 +319,32 @@ def run_all_tests():
         print(f"⚠️ {total - passed} tests failed. Please review issues above.")
         return False
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="II Indexation Checker functionality tests")
+    parser.add_argument(
+        "--only",
+        help="Comma-separated tests to run, e.g. imports,file_structure (default: all)"
+    )
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Don't wait for Enter before exiting"
+    )
+    args = parser.parse_args()
+
+    if args.only:
+        known = [selection_key(test_func) for _, test_func in SERIAL_TESTS + PARALLEL_TESTS]
+        unknown = [key for key in args.only.split(',') if key not in known]
+        if unknown:
+            parser.error(f"unknown test(s) for --only: {', '.join(unknown)} "
+                         f"(choose from {', '.join(known)})")
+    return args
+
 if __name__ == "__main__":
-    success = run_all_tests()
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    args = parse_arguments()
+    success = run_all_tests(set(args.only.split(',')) if args.only else None)
 
     if success:
         print("\n✅ READY FOR PRODUCTION")
@@ -283,4 +353,4 @@ if __name__ == "__main__":
         print("\n⚠️ NEEDS ATTENTION")
         print("Please resolve the issues above before team deployment.")
 
-    input("\nPress Enter to exit...")
\ No newline at end of file
+    pause_before_exit()
\ No newline at end of file
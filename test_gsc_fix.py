@@ -6,11 +6,14 @@ Quick diagnostic tool to test GSC API connectivity
 
 import sys
 import json
+import logging
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from test_utils import pause_before_exit
+
 def test_gsc_connectivity():
     """Test Google Search Console API connectivity"""
     print("Google Search Console API Fix Tester")
@@ -127,7 +130,8 @@ def main():
     print("   2. Google Search (always available)")
     print()
 
-    input("Press Enter to exit...")
+    pause_before_exit("Press Enter to exit...")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
\ No newline at end of file
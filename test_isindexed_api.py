@@ -5,9 +5,62 @@ Test IsIndexed.com API endpoints to understand their structure
 
 import requests
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# Probes are network-bound, so run them side by side
+PROBE_WORKERS = 16
+
+# Words on the main page that hint at an API, found in a single pass over the raw body
+API_KEYWORDS = ('api', 'endpoint', 'documentation', 'bulk', 'check')
+API_KEYWORDS_RE = re.compile(b'|'.join(keyword.encode() for keyword in API_KEYWORDS), re.IGNORECASE)
+
+def create_session():
+    """Session whose keep-alive pool covers every probe thread, so each host is connected to once"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=PROBE_WORKERS, pool_maxsize=PROBE_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def probe_endpoint(session, url, endpoint, headers):
+    """
+    Probe one URL (a base URL itself when endpoint is None)
+
+    Returns:
+        List of report lines, printed by the caller in probe order
+    """
+    if endpoint is None:
+        try:
+            response = session.get(url, headers=headers, timeout=5)
+            return [f"  Base URL: HTTP {response.status_code} - {response.text[:100]}..."]
+        except Exception as e:
+            return [f"  Base URL: ERROR - {str(e)}"]
+
+    lines = []
+    try:
+        # Try GET first
+        response = session.get(url, headers=headers, timeout=5)
+        lines.append(f"  GET {endpoint}: HTTP {response.status_code}")
+
+        if response.status_code == 200:
+            lines.append(f"    Content: {response.text[:200]}...")
+        elif response.status_code == 405:  # Method not allowed, try POST
+            test_data = {"urls": ["https://example.com"]}
+            post_response = session.post(url, headers=headers, json=test_data, timeout=5)
+            lines.append(f"  POST {endpoint}: HTTP {post_response.status_code}")
+            if post_response.status_code != 404:
+                lines.append(f"    Content: {post_response.text[:200]}...")
+
+    except Exception as e:
+        lines.append(f"  {endpoint}: ERROR - {str(e)}")
+    return lines
 
-def test_isindexed_endpoints():
+def test_isindexed_endpoints(session=None):
     """Test various IsIndexed.com API endpoints"""
+    if session is None:
+        session = create_session()
 
     # Common base URLs to try
     base_urls = [
@@ -35,54 +88,44 @@ def test_isindexed_endpoints():
     print("Testing IsIndexed.com API endpoints...")
     print("=" * 50)
 
-    for base_url in base_urls:
-        print(f"\nTesting base URL: {base_url}")
+    # Base URL first, then its endpoints - the same order the report is printed in.
+    # Full URLs are built here once, as one flat list of probes
+    probes = [
+        (base_url, endpoint, f"{base_url}{endpoint or ''}")
+        for base_url in base_urls for endpoint in (None, *endpoints)
+    ]
 
-        # Test base URL first
-        try:
-            response = requests.get(base_url, headers=headers, timeout=5)
-            print(f"  Base URL: HTTP {response.status_code} - {response.text[:100]}...")
-        except Exception as e:
-            print(f"  Base URL: ERROR - {str(e)}")
-
-        # Test endpoints
-        for endpoint in endpoints:
-            full_url = base_url + endpoint
-            try:
-                # Try GET first
-                response = requests.get(full_url, headers=headers, timeout=5)
-                print(f"  GET {endpoint}: HTTP {response.status_code}")
-
-                if response.status_code == 200:
-                    print(f"    Content: {response.text[:200]}...")
-                elif response.status_code == 405:  # Method not allowed, try POST
-                    test_data = {"urls": ["https://example.com"]}
-                    post_response = requests.post(full_url, headers=headers, json=test_data, timeout=5)
-                    print(f"  POST {endpoint}: HTTP {post_response.status_code}")
-                    if post_response.status_code != 404:
-                        print(f"    Content: {post_response.text[:200]}...")
-
-            except Exception as e:
-                print(f"  {endpoint}: ERROR - {str(e)}")
-
-def test_direct_website():
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+        reports = executor.map(
+            lambda probe: probe_endpoint(session, probe[2], probe[1], headers), probes
+        )
+
+        for (base_url, endpoint, _), lines in zip(probes, reports):
+            if endpoint is None:
+                print(f"\nTesting base URL: {base_url}")
+            for line in lines:
+                print(line)
+
+def test_direct_website(session=None):
     """Test the main website for any API clues"""
+    if session is None:
+        session = create_session()
 
     try:
-        response = requests.get("https://www.isindexed.com/en/", timeout=10)
+        response = session.get("https://www.isindexed.com/en/", timeout=10)
         print(f"\nMain website: HTTP {response.status_code}")
 
         # Look for API references in the page
-        content = response.text.lower()
-        api_keywords = ['api', 'endpoint', 'documentation', 'bulk', 'check']
+        found = {match.lower().decode() for match in API_KEYWORDS_RE.findall(response.content)}
 
-        for keyword in api_keywords:
-            if keyword in content:
+        for keyword in API_KEYWORDS:
+            if keyword in found:
                 print(f"Found '{keyword}' on main page")
 
     except Exception as e:
         print(f"Main website error: {e}")
 
 if __name__ == "__main__":
-    test_isindexed_endpoints()
-    test_direct_website()
\ No newline at end of file
+    session = create_session()
+    test_isindexed_endpoints(session)
+    test_direct_website(session)
\ No newline at end of file
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Regression test: a checker results CSV uploaded to Google Sheets must show up in the Summary tab
+
+Runs against in-memory stand-ins for the spreadsheet, so no credentials or network are needed.
+Run directly (python test_sheets_summary.py) or with pytest.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import threading
+import types
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# The integration only needs gspread's exception types here; fall back to
+# placeholders when the Google libraries aren't installed
+try:
+    import gspread  # noqa: F401
+    from google.oauth2.service_account import Credentials  # noqa: F401
+except ImportError:
+    gspread_stub = types.ModuleType('gspread')
+    gspread_stub.exceptions = types.SimpleNamespace(APIError=type('APIError', (Exception,), {}))
+    gspread_stub.WorksheetNotFound = type('WorksheetNotFound', (Exception,), {})
+    gspread_stub.SpreadsheetNotFound = type('SpreadsheetNotFound', (Exception,), {})
+    sys.modules['gspread'] = gspread_stub
+    for name in ('google', 'google.oauth2', 'google.oauth2.service_account'):
+        sys.modules.setdefault(name, types.ModuleType(name))
+    sys.modules['google.oauth2.service_account'].Credentials = None
+
+import gspread
+from google_sheets_integration import GoogleSheetsIntegration
+
+# Header the checker writes (indexation_checker.CSV_HEADER)
+CHECKER_CSV_HEADER = ['URL', 'Status', 'Method', 'Check_Date']
+
+class FakeWorksheet:
+    def __init__(self, title):
+        self.title = title
+        self.rows = []
+
+    def append_row(self, row):
+        self.rows.append(list(row))
+
+    def append_rows(self, rows):
+        self.rows.extend(list(row) for row in rows)
+
+    def clear(self):
+        self.rows = []
+
+class FakeSpreadsheet:
+    def __init__(self):
+        self.tabs = {}
+
+    def worksheet(self, title):
+        if title not in self.tabs:
+            raise gspread.WorksheetNotFound(title)
+        return self.tabs[title]
+
+    def worksheets(self):
+        return list(self.tabs.values())
+
+    def add_worksheet(self, title, rows, cols):
+        self.tabs[title] = FakeWorksheet(title)
+        return self.tabs[title]
+
+    def values_batch_get(self, ranges):
+        value_ranges = []
+        for cell_range in ranges:
+            title, columns = cell_range.rsplit('!', 1)
+            width = ord(columns.split(':')[1]) - ord('A') + 1
+            rows = self.tabs[title.strip("'").replace("''", "'")].rows
+            value_ranges.append({'values': [row[:width] for row in rows]})
+        return {'valueRanges': value_ranges}
+
+def make_integration(spreadsheet):
+    """GoogleSheetsIntegration wired to a fake spreadsheet instead of the API"""
+    sheets = GoogleSheetsIntegration.__new__(GoogleSheetsIntegration)
+    sheets.credentials_file = None
+    sheets.client = object()
+    sheets.lock = threading.RLock()
+    sheets._spreadsheets = {"Website Indexation Results": spreadsheet}
+    sheets._worksheets = {}
+    return sheets
+
+def write_checker_csv(directory, rows):
+    """Write results in the checker's URL,Status,Method,Check_Date format"""
+    filename = os.path.join(directory, 'example_site_indexation_results.csv')
+    with open(filename, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(CHECKER_CSV_HEADER)
+        writer.writerows(rows)
+    return filename
+
+def test_summary_counts_uploaded_checker_csv():
+    spreadsheet = FakeSpreadsheet()
+    sheets = make_integration(spreadsheet)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = write_checker_csv(directory, [
+            ['https://example.com/', 'INDEXED', 'Search Console Data', '2025-09-20 09:00:00'],
+            ['https://example.com/a/', 'INDEXED', 'Google Search', '2025-09-20 09:00:00'],
+            ['https://example.com/b/', 'NOT INDEXED', 'Google Search', '2025-09-20 09:00:00'],
+        ])
+        assert sheets.upload_results(filename)
+
+    website_tab = spreadsheet.tabs['Example Site']
+    assert website_tab.rows[0] == ['URL', 'Status', 'Check_Date']
+    assert website_tab.rows[1] == ['https://example.com/', 'INDEXED', '2025-09-20 09:00:00']
+
+    assert sheets.create_summary_sheet()
+    summary = spreadsheet.tabs['Summary'].rows
+    assert summary[1:] == [['Example Site', 3, 2, 1, '66.7%', '2025-09-20 09:00:00']]
+
+def test_summary_reads_tabs_with_method_column():
+    """Tabs filled before uploads dropped the Method column still summarize by date"""
+    spreadsheet = FakeSpreadsheet()
+    old_tab = spreadsheet.add_worksheet('Old Site', rows=1000, cols=10)
+    old_tab.append_rows([
+        ['URL', 'Status', 'Check_Date'],
+        ['https://old.example/', 'INDEXED', 'Google Search', '2025-09-19 09:00:00'],
+        ['https://old.example/', 'NOT INDEXED', '2025-09-20 09:00:00'],
+    ])
+    sheets = make_integration(spreadsheet)
+
+    assert sheets.create_summary_sheet()
+    summary = spreadsheet.tabs['Summary'].rows
+    assert summary[1:] == [['Old Site', 1, 0, 1, '0.0%', '2025-09-20 09:00:00']]
+
+if __name__ == "__main__":
+    test_summary_counts_uploaded_checker_csv()
+    test_summary_reads_tabs_with_method_column()
+    print("[PASS] Sheets summary tests passed")
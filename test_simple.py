@@ -11,6 +11,8 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from test_utils import pause_before_exit
+
 def main():
     print("II Indexation Checker - Quick Functionality Test")
     print("=" * 50)
@@ -39,6 +41,8 @@ def main():
         print(f"[PASS] Configuration loaded - {len(websites)} websites found")
         for website in websites:
             print(f"  - {website.get('name', 'Unknown')}")
+    except FileNotFoundError:
+        print("[FAIL] Configuration loading failed: config/websites.json not found")
     except Exception as e:
         print(f"[FAIL] Configuration loading failed: {e}")
 
@@ -87,7 +91,7 @@ def main():
     print("BASIC FUNCTIONALITY TEST COMPLETE")
     print("If all tests passed, the application should work for your team!")
 
-    input("\nPress Enter to exit...")
+    pause_before_exit()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
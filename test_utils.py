@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the II Indexation Checker test scripts
+"""
+
+import sys
+
+def pause_before_exit(prompt="\nPress Enter to exit..."):
+    """Keep a double-clicked console window open; skipped for piped/CI runs or with --no-wait"""
+    if sys.stdin.isatty() and '--no-wait' not in sys.argv:
+        input(prompt)
@@ -5,7 +5,7 @@ Upload indexation results to Google Sheets
 
 import sys
 import argparse
-import os
+import logging
 from pathlib import Path
 
 # Add src directory to path
@@ -37,16 +37,18 @@ def main():
     """Main function"""
     args = parse_arguments()
 
-    # Change to script directory
-    os.chdir(Path(__file__).parent)
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
-    # Change to results directory
-    if Path(args.results_dir).exists():
-        os.chdir(args.results_dir)
+    # Resolve paths against the script directory instead of changing into it
+    script_dir = Path(__file__).parent
+    results_dir = script_dir / args.results_dir
+    if not results_dir.exists():
+        results_dir = script_dir
 
     # Run sheets integration
     try:
-        sheets_main()
+        sheets_main(results_dir=str(results_dir), sheet_name=args.sheet_name,
+                    credentials_file=str(script_dir / 'config' / 'google_credentials.json'))
     except KeyboardInterrupt:
         print("\n⚠️  Upload interrupted by user")
         sys.exit(1)